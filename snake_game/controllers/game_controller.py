@@ -4,6 +4,8 @@ Copyright (c) 2025 Thomas Nelson (https://github.com/sfelf)
 Licensed under CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)
 """
 
+import time
+
 import pygame
 
 from snake_game.controllers.input_handler import InputHandler
@@ -11,6 +13,11 @@ from snake_game.models import Fruit, GameState, GameStateManager, ScoreManager,
 from snake_game.utils import AudioManager, GameConstants
 from snake_game.views import GameRenderer
 
+# Dirty areas are only pushed rect by rect while they are few and small;
+# beyond this a single full-window flip is cheaper
+_MAX_UPDATE_RECTS = 20
+_MAX_UPDATE_AREA = GameConstants.WINDOW_WIDTH * GameConstants.WINDOW_HEIGHT // 10
+
 
 class GameController:
     """Main controller that orchestrates the game."""
@@ -27,11 +34,20 @@ class GameController:
         pygame.display.set_caption("Snake Game")
         self.clock = pygame.time.Clock()
 
+        # Only QUIT, KEYDOWN and window exposure are handled; drop everything
+        # else in SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED])
+
+        # Static screens are only presented when they change, so the whole
+        # window is presented again after it has been uncovered
+        self.window_exposed = False
+
         # Initialize game components
         self.snake = Snake(
             GameConstants.INITIAL_SNAKE_LENGTH,
-            GameConstants.GRID_WIDTH // 2,
-            GameConstants.GRID_HEIGHT // 2,
+            GameConstants.GRID_CENTER_X,
+            GameConstants.GRID_CENTER_Y,
         )
         self.fruit = Fruit(GameConstants.GRID_WIDTH, GameConstants.GRID_HEIGHT)
         self.state_manager = GameStateManager()
@@ -42,7 +58,8 @@ class GameController:
 
         # Game timing
         self.speed = GameConstants.INITIAL_SPEED
-        self.last_move_time = 0
+        self.last_update_ns = time.monotonic_ns()
+        self.move_accumulator_ns = 0
 
         # Initialize game
         self._reset_game()
@@ -56,6 +73,8 @@ class GameController:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self.window_exposed = True
                 else:
                     action = self.input_handler.handle_event(
                         event, self.state_manager.current_state
@@ -126,7 +145,8 @@ class GameController:
         self._reset_game()
         self.state_manager.set_state(GameState.PLAYING)
         self.audio_manager.start_background_music()
-        self.last_move_time = pygame.time.get_ticks()
+        self.last_update_ns = time.monotonic_ns()
+        self.move_accumulator_ns = 0
 
     def _restart_game(self) -> None:
         """Restart the game."""
@@ -136,28 +156,45 @@ class GameController:
         """Reset the game to initial state."""
         self.snake.reset(
             GameConstants.INITIAL_SNAKE_LENGTH,
-            GameConstants.GRID_WIDTH // 2,
-            GameConstants.GRID_HEIGHT // 2,
+            GameConstants.GRID_CENTER_X,
+            GameConstants.GRID_CENTER_Y,
         )
         self.fruit.spawn(self.snake.segments)
         self.score_manager.reset_current_score()
         self.speed = GameConstants.INITIAL_SPEED
 
     def _update(self) -> None:
-        """Update game logic."""
+        """Update game logic.
+
+        Movement runs on a fixed step of ``self.speed`` milliseconds measured
+        with a monotonic clock, independent of the render frame rate.
+        """
+        current_time = time.monotonic_ns()
+        elapsed = current_time - self.last_update_ns
+        self.last_update_ns = current_time
+
         if not self.state_manager.is_state(GameState.PLAYING):
             return
 
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_move_time >= self.speed:
+        step_ns = self.speed * 1_000_000
+        self.move_accumulator_ns = min(
+            self.move_accumulator_ns + elapsed,
+            step_ns * GameConstants.MAX_CATCH_UP_MOVES,
+        )
+        while self.move_accumulator_ns >= step_ns:
+            self.move_accumulator_ns -= step_ns
             self._move_snake()
-            self.last_move_time = current_time
+            if not self.state_manager.is_state(GameState.PLAYING):
+                self.move_accumulator_ns = 0
+                return
+            step_ns = self.speed * 1_000_000
 
     def _move_snake(self) -> None:
         """Move the snake and handle game logic."""
         # Check fruit collision first to determine if snake should grow
         head_x, head_y = self.snake.head
-        dx, dy = self.snake.next_direction.value
+        next_direction = self.snake.next_direction
+        dx, dy = next_direction.dx, next_direction.dy
         next_head_pos = (head_x + dx, head_y + dy)
 
         will_eat_fruit = self.fruit.is_eaten_by(next_head_pos)
@@ -211,25 +248,39 @@ class GameController:
         self.audio_manager.play_game_over_sound()
 
     def _render(self) -> None:
-        """Render the current game state."""
+        """Render the current game state.
+
+        Only the window areas the renderer reports as changed are pushed to the
+        display, or the whole window when they are too many or too large to
+        pay off; frames where nothing changed skip the update entirely.
+        """
         current_state = self.state_manager.current_state
+        dirty_areas = []
 
         if current_state == GameState.SPLASH:
-            self.renderer.render_splash_screen()
+            dirty_areas = self.renderer.render_splash_screen()
         elif current_state == GameState.PLAYING:
-            self.renderer.render_game_screen(
+            dirty_areas = self.renderer.render_game_screen(
                 self.snake, self.fruit, self.score_manager.score, self.speed
             )
         elif current_state == GameState.GAME_OVER:
             is_high_score = self.score_manager.is_high_score()
-            self.renderer.render_game_over_screen(
+            dirty_areas = self.renderer.render_game_over_screen(
                 self.score_manager.score, is_high_score
             )
         elif current_state == GameState.HIGH_SCORES:
-            self.renderer.render_high_scores_screen(
+            dirty_areas = self.renderer.render_high_scores_screen(
                 self.score_manager.get_high_scores()
             )
         elif current_state == GameState.CONFIRM_RESET:
-            self.renderer.render_confirm_reset_screen()
-
-        pygame.display.flip()
+            dirty_areas = self.renderer.render_confirm_reset_screen()
+
+        if self.window_exposed:
+            self.window_exposed = False
+            pygame.display.flip()
+        elif dirty_areas:
+            dirty_area = sum(width * height for _, _, width, height in dirty_areas)
+            if len(dirty_areas) > _MAX_UPDATE_RECTS or dirty_area > _MAX_UPDATE_AREA:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_areas)
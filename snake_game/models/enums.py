@@ -11,6 +11,16 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+    def __init__(self, dx: int, dy: int):
+        """Store the grid delta as plain attributes for the movement hot path.
+
+        Args:
+            dx: Horizontal grid step
+            dy: Vertical grid step
+        """
+        self.dx = dx
+        self.dy = dy
+
 
 class GameState(Enum):
     """Game state enumeration."""
@@ -5,6 +5,8 @@ from typing import List, Tuple
 
 from snake_game.models.enums import FruitType
 
+_FRUIT_TYPES: Tuple[FruitType, ...] = tuple(FruitType)
+
 
 class Fruit:
     """Represents a fruit in the game."""
@@ -38,7 +40,7 @@ class Fruit:
 
             if (x, y) not in occupied_positions:
                 self.position = (x, y)
-                self.fruit_type = random.choice(list(FruitType))
+                self.fruit_type = random.choice(_FRUIT_TYPES)
                 break
 
         return self.position
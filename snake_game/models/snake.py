@@ -1,9 +1,16 @@
 """Snake model for the Snake Game."""
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from snake_game.models.enums import Direction
 
+_OPPOSITE_DIRECTIONS: Dict[Direction, Direction] = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
 
 class Snake:
     """Represents the snake in the game."""
@@ -44,14 +51,7 @@ class Snake:
             True if direction was set, False if invalid (opposite direction)
         """
         # Prevent moving in opposite direction
-        opposite_directions = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
-
-        if new_direction != opposite_directions.get(self.direction):
+        if new_direction is not _OPPOSITE_DIRECTIONS[self.direction]:
             self.next_direction = new_direction
             return True
         return False
@@ -66,12 +66,11 @@ class Snake:
             The new head position
         """
         # Update direction
-        self.direction = self.next_direction
+        direction = self.direction = self.next_direction
 
         # Calculate new head position
         head_x, head_y = self.head
-        dx, dy = self.direction.value
-        new_head = (head_x + dx, head_y + dy)
+        new_head = (head_x + direction.dx, head_y + direction.dy)
 
         # Add new head
         self.segments.insert(0, new_head)
@@ -1,5 +1,6 @@
 """Audio management for the Snake Game."""
 
+import threading
 from typing import Optional
 
 import numpy as np
@@ -19,6 +20,12 @@ class AudioManager:
         self.game_over_sound: Optional[pygame.mixer.Sound] = None
         self.move_sound: Optional[pygame.mixer.Sound] = None
 
+        # Background music is baked on a worker thread, see _create_background_music
+        self._music_lock = threading.Lock()
+        self._music_thread: Optional[threading.Thread] = None
+        self._melody_sound: Optional[pygame.mixer.Sound] = None
+        self._melody_baked = False
+
         self._initialize_audio()
 
     def _initialize_audio(self):
@@ -51,16 +58,32 @@ class AudioManager:
             self.move_sound = None
 
     def _create_background_music(self):
-        """Create background music."""
+        """Start baking the background music without blocking startup.
+
+        Synthesizing the melody takes a noticeable amount of time, so it runs
+        on a daemon thread while the splash screen is shown. Playback starts
+        as soon as the melody is ready if it has been requested by then.
+        """
+        self._music_thread = threading.Thread(
+            target=self._bake_background_music, name="melody-baker", daemon=True
+        )
+        self._music_thread.start()
+
+    def _bake_background_music(self):
+        """Generate the melody sound and start it if music was requested."""
         try:
             melody_data = self._generate_melody()
-            if melody_data:
-                # Save melody to a temporary buffer for pygame
-                pygame.mixer.Sound(buffer=melody_data)
-                # Note: For continuous music, we'd need to save to a file
-                # For now, we'll play the generated sound in a loop
+            melody_sound = (
+                pygame.mixer.Sound(buffer=melody_data) if melody_data else None
+            )
         except (pygame.error, ImportError):
-            pass
+            melody_sound = None
+
+        with self._music_lock:
+            self._melody_sound = melody_sound
+            self._melody_baked = True
+            if self.music_playing:
+                self._play_melody()
 
     def _generate_tone(self, frequency: float, duration: float) -> bytes:
         """Generate a simple tone for sound effects.
@@ -229,36 +252,50 @@ class AudioManager:
         except pygame.error:
             pass
 
+    def _play_melody(self):
+        """Loop the baked melody on the music channel.
+
+        Must be called with ``_music_lock`` held.
+        """
+        if self._melody_sound is None:
+            self.music_playing = False
+            return
+
+        try:
+            pygame.mixer.Channel(0).play(self._melody_sound, loops=-1)
+            pygame.mixer.Channel(0).set_volume(0.3)
+        except pygame.error:
+            self.music_playing = False
+
     def start_background_music(self):
-        """Start playing background music."""
+        """Start playing background music.
+
+        If the melody is still being baked, playback begins once it is ready.
+        """
         if not self.initialized or self.music_playing:
             return
 
-        try:
-            # For now, we'll create a simple looping tone
-            # In a full implementation, you'd load a music file
-            melody_sound = pygame.mixer.Sound(buffer=self._generate_melody() or b"")
-            if melody_sound:
-                # Play the melody sound in a loop (simplified approach)
-                pygame.mixer.Channel(0).play(melody_sound, loops=-1)
-                pygame.mixer.Channel(0).set_volume(0.3)
-                self.music_playing = True
-        except (pygame.error, TypeError):
-            pass
+        with self._music_lock:
+            self.music_playing = True
+            if self._melody_baked:
+                self._play_melody()
 
     def stop_background_music(self):
         """Stop background music."""
         if not self.initialized or not self.music_playing:
             return
 
-        try:
-            pygame.mixer.Channel(0).stop()
+        with self._music_lock:
             self.music_playing = False
-        except pygame.error:
-            pass
+            try:
+                pygame.mixer.Channel(0).stop()
+            except pygame.error:
+                pass
 
     def cleanup(self):
         """Clean up audio resources."""
         if self.initialized:
             self.stop_background_music()
+            if self._music_thread is not None:
+                self._music_thread.join()
             pygame.mixer.quit()
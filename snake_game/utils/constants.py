@@ -10,6 +10,9 @@ class GameConstants:
     GRID_WIDTH = 40
     GRID_HEIGHT = 30
     CELL_SIZE = 20
+    HALF_CELL = CELL_SIZE // 2
+    GRID_CENTER_X = GRID_WIDTH // 2
+    GRID_CENTER_Y = GRID_HEIGHT // 2
 
     # UI layout
     BORDER_WIDTH = 2
@@ -18,6 +21,7 @@ class GameConstants:
     # Window dimensions
     WINDOW_WIDTH = GRID_WIDTH * CELL_SIZE + (BORDER_WIDTH * 2)
     WINDOW_HEIGHT = GRID_HEIGHT * CELL_SIZE + (BORDER_WIDTH * 2) + UI_HEIGHT
+    WINDOW_CENTER_X = WINDOW_WIDTH // 2
 
     # Playing area
     PLAY_AREA_X = BORDER_WIDTH
@@ -31,6 +35,7 @@ class GameConstants:
     SPEED_INCREASE = 10  # speed increase per fruit eaten
     MIN_SPEED = 50  # minimum speed (maximum difficulty)
     POINTS_PER_FRUIT = 4
+    MAX_CATCH_UP_MOVES = 3  # moves replayed at most after a stalled frame
 
     # Colors
     BLACK: Tuple[int, int, int] = (0, 0, 0)
@@ -1,11 +1,82 @@
 """Path smoothing utilities for creating smooth snake curves."""
 
-import math
-from typing import List, Optional, Tuple
+import functools
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 from snake_game.utils.constants import GameConstants
 
 
+def _unit_ramp(num_points: int) -> np.ndarray:
+    """Return ``i / (num_points - 1)`` for each step, matching scalar division."""
+    return np.arange(num_points) / (num_points - 1)
+
+
+# Two-point path: parameters as a column and a reusable float result buffer
+_T8_COLUMN = _unit_ramp(8)[:, None]
+_SCRATCH_8 = np.empty((8, 2), dtype=np.float64)
+
+# Grid to screen affine transform: screen = grid * CELL_SIZE + offset
+_CELL_SIZE = np.int32(GameConstants.CELL_SIZE)
+_SCREEN_OFFSET = np.array(
+    [
+        GameConstants.PLAY_AREA_X + GameConstants.HALF_CELL,
+        GameConstants.PLAY_AREA_Y + GameConstants.HALF_CELL,
+    ],
+    dtype=np.int32,
+)
+
+
+# Catmull-Rom basis: rows give the a, b, c, d polynomial coefficients as
+# combinations of the control points p0..p3
+_CATMULL_ROM_BASIS = np.array(
+    [[0, 2, 0, 0], [-1, 0, 1, 0], [2, -5, 4, -1], [-1, 3, -3, 1]], dtype=np.int64
+)
+
+
+def _catmull_rom_weights(num_points: int) -> Tuple[np.ndarray, int]:
+    """Build the Catmull-Rom weight matrix for ``t = i / (num_points - 1)``.
+
+    Only ``i >= 1`` is included since the first point of every curve repeats
+    the end of the previous piece. Scaling by ``2 * (num_points - 1) ** 3``
+    makes every weight an integer, so a curve point is the exact rational
+    ``control_points @ weights / scale``.
+
+    Args:
+        num_points: Number of points per curve, including the start point
+
+    Returns:
+        Tuple of the (4, num_points - 1) integer weights and the scale
+    """
+    n = num_points - 1
+    i = np.arange(1, num_points, dtype=np.int64)
+    powers = np.vstack((np.full_like(i, n**3), i * n**2, i * i * n, i**3))
+    return _CATMULL_ROM_BASIS.T @ powers, 2 * n**3
+
+
+_CR_WEIGHTS, _CR_SCALE = _catmull_rom_weights(16)
+_CR_STEP_WEIGHTS = np.ascontiguousarray(_CR_WEIGHTS.T)
+_CURVE_STEPS = _CR_WEIGHTS.shape[1]
+
+
+@functools.lru_cache(maxsize=16)
+def _window_index(count: int) -> np.ndarray:
+    """Return the (count - 3, 4) indices of every four-point spline window.
+
+    The snake's length changes only when it eats, so the gather index for the
+    current length is built once and reused every frame until then.
+    """
+    index = np.arange(count - 3)[:, None] + np.arange(4)
+    index.setflags(write=False)
+    return index
+
+
+def _to_point_list(pts: np.ndarray) -> List[Tuple[int, int]]:
+    """Convert an (N, 2) array into a list of (x, y) int tuples."""
+    return list(zip(pts[:, 0].tolist(), pts[:, 1].tolist()))
+
+
 class PathSmoother:
     """Handles path smoothing and curve generation for snake movement."""
 
@@ -22,173 +93,93 @@ class PathSmoother:
         if len(points) < 2:
             return points
 
-        if len(points) == 2:
-            # For short snake, interpolate between head and tail
-            return PathSmoother._interpolate_points(points[0], points[1], 8)
-
-        smooth_points = []
-
-        # Start with head - ensure smooth start
-        smooth_points.append(points[0])
-
-        # Handle first segment specially to avoid head issues
-        if len(points) > 2:
-            # Smooth transition from head to first body segment
-            head_to_first = PathSmoother._interpolate_points(points[0], points[1], 10)
-            smooth_points.extend(head_to_first[1:])  # Skip first point (already added)
-
-        # Create smooth curves between remaining segments
-        for i in range(1, len(points) - 1):
-            start_point = points[i]
-            end_point = points[i + 1]
-
-            # Get context points for better curve calculation
-            prev_point = points[i - 1] if i > 0 else None
-            next_point = points[i + 2] if i + 2 < len(points) else None
-
-            # Create smooth interpolation between segments
-            if i == len(points) - 2:  # Last segment
-                # Simple interpolation to tail
-                interpolated = PathSmoother._interpolate_points(
-                    start_point, end_point, 8
-                )
-                smooth_points.extend(
-                    interpolated[1:]
-                )  # Skip first point (already added)
-            else:
-                # Create curved path considering neighboring segments
-                # Reduce curve intensity near head to prevent issues
-                curve_intensity = min(1.0, i / 3.0)  # Gradual curve increase from head
-                curved_points = PathSmoother._create_curved_segment(
-                    start_point, end_point, prev_point, next_point, curve_intensity
-                )
-                smooth_points.extend(
-                    curved_points[1:]
-                )  # Skip first point (already added)
-
-        return smooth_points
+        return _to_point_list(PathSmoother.create_smooth_path_arr(np.asarray(points)))
 
     @staticmethod
-    def _interpolate_points(
-        start_point: Tuple[int, int], end_point: Tuple[int, int], num_points: int
+    def create_smooth_segment_path(
+        segments: Sequence[Tuple[int, int]],
     ) -> List[Tuple[int, int]]:
-        """Create smooth interpolation between two points.
+        """Create the smooth screen path for snake segments in grid coordinates.
+
+        Converts and smooths the segments as one array, without building the
+        intermediate list of screen points.
 
         Args:
-            start_point: Starting point (x, y)
-            end_point: Ending point (x, y)
-            num_points: Number of interpolation points
+            segments: Snake segment positions in grid coordinates
 
         Returns:
-            List of interpolated points
+            List of smoothed screen points for drawing
         """
-        points = []
-        for i in range(num_points):
-            t = i / (num_points - 1)
-            x = int(start_point[0] + (end_point[0] - start_point[0]) * t)
-            y = int(start_point[1] + (end_point[1] - start_point[1]) * t)
-            points.append((x, y))
-        return points
+        screen_points = PathSmoother.convert_segments_to_screen_array(segments)
+        return _to_point_list(PathSmoother.create_smooth_path_arr(screen_points))
 
     @staticmethod
-    def _create_curved_segment(
-        start_point: Tuple[int, int],
-        end_point: Tuple[int, int],
-        prev_point: Optional[Tuple[int, int]],
-        next_point: Optional[Tuple[int, int]],
-        curve_intensity: float = 1.0,
-    ) -> List[Tuple[int, int]]:
-        """Create a curved segment with enhanced smoothness and controlled arcing.
+    def create_smooth_path_arr(pts: np.ndarray) -> np.ndarray:
+        """Create a smooth path from an array of points.
+
+        Array counterpart of create_smooth_path for callers that already hold
+        the points as an array, avoiding tuple packing on both sides.
 
         Args:
-            start_point: Current segment start
-            end_point: Current segment end
-            prev_point: Previous segment (for curve context)
-            next_point: Next segment (for curve context)
-            curve_intensity: Intensity of curve (0.0 to 1.0) to control near-head smoothness
+            pts: Screen coordinate points of shape (N, 2)
 
         Returns:
-            List of points forming an ultra-smooth curve
+            Smoothed points as an int32 array of shape (M, 2)
         """
-        # Increased interpolation points for maximum smoothness
-        num_points = 16
-        curve_points = []
-
-        for i in range(num_points):
-            t = i / (num_points - 1)
-
-            # Use enhanced Catmull-Rom spline for ultra-smooth curves
-            if prev_point and next_point:
-                # Full spline with 4 control points and tension adjustment
-                point = PathSmoother._enhanced_catmull_rom_spline(
-                    prev_point, start_point, end_point, next_point, t
-                )
-            else:
-                # Enhanced interpolation with controlled curve bias
-                # Enhanced curve factor with intensity control
-                base_curve_factor = 0.4 * math.sin(t * math.pi)
-                curve_factor = (
-                    base_curve_factor * curve_intensity
-                )  # Apply intensity control
-
-                # Perpendicular offset for enhanced curve
-                dx = end_point[0] - start_point[0]
-                dy = end_point[1] - start_point[1]
-                length = math.sqrt(dx * dx + dy * dy)
-
-                if length > 0:
-                    perp_x = -dy / length * curve_factor * 15  # Curve strength
-                    perp_y = dx / length * curve_factor * 15
-                else:
-                    perp_x = perp_y = 0
-
-                x = int(start_point[0] + (end_point[0] - start_point[0]) * t + perp_x)
-                y = int(start_point[1] + (end_point[1] - start_point[1]) * t + perp_y)
-                point = (x, y)
-
-            curve_points.append(point)
-
-        return curve_points
+        if len(pts) < 2:
+            return np.asarray(pts, dtype=np.int32).reshape(-1, 2)
+
+        if len(pts) == 2:
+            # For short snake, interpolate between head and tail
+            # Evaluated in place in a scratch buffer; only the returned int
+            # array is allocated. Rendering is single-threaded, so sharing
+            # the scratch buffer is safe.
+            np.multiply(pts[1] - pts[0], _T8_COLUMN, out=_SCRATCH_8)
+            np.add(_SCRATCH_8, pts[0], out=_SCRATCH_8)
+            return _SCRATCH_8.astype(np.int32)
+
+        # Reflect the end points into ghost neighbours so every real segment,
+        # head and tail included, gets a full four-point spline window
+        count = len(pts)
+        padded = np.empty((count + 2, 2), dtype=np.result_type(pts.dtype, np.int64))
+        padded[1:-1] = pts
+        padded[0] = 2 * pts[0] - pts[1]
+        padded[-1] = 2 * pts[-1] - pts[-2]
+
+        # The output size is known up front: the head, then every segment's
+        # curve without its first point, which ends the previous curve
+        smooth = np.empty((1 + (count - 1) * _CURVE_STEPS, 2), dtype=np.int32)
+        smooth[0] = pts[0]
+        PathSmoother._catmull_rom_segments(padded, smooth[1:])
+        return smooth
 
     @staticmethod
-    def _enhanced_catmull_rom_spline(
-        p0: Tuple[int, int],
-        p1: Tuple[int, int],
-        p2: Tuple[int, int],
-        p3: Tuple[int, int],
-        t: float,
-    ) -> Tuple[int, int]:
-        """Calculate enhanced Catmull-Rom spline with tension control for ultra-smooth curves.
+    def _catmull_rom_segments(pts: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Evaluate the Catmull-Rom curve of every interior segment at once.
+
+        Segment ``i`` runs from ``pts[i]`` to ``pts[i + 1]`` with ``pts[i - 1]``
+        and ``pts[i + 2]`` as context, for every ``i`` that has both
+        neighbours. Each segment is one small matmul of its control points
+        against the precomputed weight matrix, done in integers so there is
+        no rounding drift before the final division.
 
         Args:
-            p0, p1, p2, p3: Control points
-            t: Parameter (0 to 1)
+            pts: Control points of shape (N, 2)
+            out: int32 array of shape ((N - 3) * 15, 2) receiving the
+                truncated curve points, segment by segment
 
         Returns:
-            Interpolated point (x, y)
+            The ``out`` array
         """
-        # Enhanced tension parameter for smoother curves
-        tension = 0.5  # Standard Catmull-Rom tension
-
-        t2 = t * t
-        t3 = t2 * t
-
-        # Enhanced Catmull-Rom spline formula with tension
-        x = tension * (
-            (2 * p1[0])
-            + (-p0[0] + p2[0]) * t
-            + (2 * p0[0] - 5 * p1[0] + 4 * p2[0] - p3[0]) * t2
-            + (-p0[0] + 3 * p1[0] - 3 * p2[0] + p3[0]) * t3
+        # (step, control point) @ (segment, control point, axis)
+        windows = pts[_window_index(len(pts))]
+        np.divide(
+            _CR_STEP_WEIGHTS @ windows,
+            _CR_SCALE,
+            out=out.reshape(-1, _CURVE_STEPS, 2),
+            casting="unsafe",
         )
-
-        y = tension * (
-            (2 * p1[1])
-            + (-p0[1] + p2[1]) * t
-            + (2 * p0[1] - 5 * p1[1] + 4 * p2[1] - p3[1]) * t2
-            + (-p0[1] + 3 * p1[1] - 3 * p2[1] + p3[1]) * t3
-        )
-
-        return (int(x), int(y))
+        return out
 
     @staticmethod
     def convert_segments_to_screen_points(
@@ -202,17 +193,24 @@ class PathSmoother:
         Returns:
             List of screen coordinate points
         """
-        screen_points = []
-        for x, y in segments:
-            screen_x = (
-                GameConstants.PLAY_AREA_X
-                + x * GameConstants.CELL_SIZE
-                + GameConstants.CELL_SIZE // 2
-            )
-            screen_y = (
-                GameConstants.PLAY_AREA_Y
-                + y * GameConstants.CELL_SIZE
-                + GameConstants.CELL_SIZE // 2
-            )
-            screen_points.append((screen_x, screen_y))
-        return screen_points
+        if not segments:
+            return []
+
+        return _to_point_list(PathSmoother.convert_segments_to_screen_array(segments))
+
+    @staticmethod
+    def convert_segments_to_screen_array(
+        segments: Sequence[Tuple[int, int]],
+    ) -> np.ndarray:
+        """Convert grid positions to screen coordinates as an array.
+
+        Args:
+            segments: Snake segment positions in grid coordinates
+
+        Returns:
+            Screen coordinate points as an int32 array of shape (N, 2)
+        """
+        if len(segments) == 0:
+            return np.empty((0, 2), dtype=np.int32)
+
+        return np.asarray(segments, dtype=np.int32) * _CELL_SIZE + _SCREEN_OFFSET
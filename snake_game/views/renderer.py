@@ -2,7 +2,7 @@
 
 import math
 import os
-from typing import Dict, List
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 
 import pygame
 
@@ -14,6 +14,131 @@ from snake_game.views.snake_renderer import (
     SnakeHeadRenderer,
     SnakeScaleRenderer,
 )
+from snake_game.views.surfaces import convert, convert_alpha, render_sprite
+
+# Maximum number of rendered text surfaces kept by GameRenderer
+_TEXT_CACHE_SIZE = 256
+
+# Red levels of the pulsing game over title over one period of
+# abs(sin(ticks * 0.005)), sampled every _PULSE_STEP_MS milliseconds
+_PULSE_PERIOD_MS = round(math.pi / 0.005)
+_PULSE_STEP_MS = 16
+_PULSE_REDS: Tuple[int, ...] = tuple(
+    int(255 * (abs(math.sin(ticks * 0.005)) * 0.3 + 0.7))
+    for ticks in range(0, _PULSE_PERIOD_MS, _PULSE_STEP_MS)
+)
+
+# Fixed window areas (x, y, width, height) of the game screen. The game area
+# is the border together with the play area it encloses.
+_WINDOW_AREA = (0, 0, GameConstants.WINDOW_WIDTH, GameConstants.WINDOW_HEIGHT)
+_UI_AREA = (0, 0, GameConstants.WINDOW_WIDTH, GameConstants.UI_HEIGHT)
+_GAME_AREA = (
+    0,
+    GameConstants.UI_HEIGHT,
+    GameConstants.WINDOW_WIDTH,
+    GameConstants.PLAY_AREA_HEIGHT + GameConstants.BORDER_WIDTH * 2,
+)
+_PLAY_AREA = (
+    GameConstants.PLAY_AREA_X,
+    GameConstants.PLAY_AREA_Y,
+    GameConstants.PLAY_AREA_WIDTH,
+    GameConstants.PLAY_AREA_HEIGHT,
+)
+
+# Offsets of the fallback splash snake's segments from the logo center,
+# tail first, along a gentle sine wave
+_SPLASH_LOGO_OFFSETS: Tuple[Tuple[int, int], ...] = tuple(
+    (-100 + i * 25, int(20 * math.sin(i * 0.5))) for i in range(8)
+)
+
+# Decorative splash fruits (x, y, type), placed around the title and the
+# instructions: title at y=200, instructions from y=280 to y=480
+_SPLASH_FRUITS: Tuple[Tuple[int, int, FruitType], ...] = (
+    # Top corners (above title)
+    (80, 150, FruitType.APPLE),
+    (GameConstants.WINDOW_WIDTH - 80, 140, FruitType.BANANA),
+    # Side areas (between title and instructions)
+    (60, 240, FruitType.CHERRY),
+    (GameConstants.WINDOW_WIDTH - 60, 250, FruitType.ORANGE),
+    # Bottom area (below instructions)
+    (GameConstants.WINDOW_CENTER_X - 60, 520, FruitType.PEAR),
+    (GameConstants.WINDOW_CENTER_X + 60, 510, FruitType.APPLE),
+    # Additional decorative fruits in safe areas
+    (120, 480, FruitType.BANANA),
+    (GameConstants.WINDOW_WIDTH - 120, 490, FruitType.CHERRY),
+)
+
+# Instruction lines of the menu screens; empty lines leave a gap
+_SPLASH_INSTRUCTIONS: Tuple[str, ...] = (
+    "Use arrow keys to control the snake",
+    "Eat different fruits to grow and score points",
+    "Avoid hitting walls and yourself",
+    "Each fruit gives 4 points and increases speed",
+    "",
+    "Press any key to start!",
+    "Press H to view high scores",
+    "Press Q to quit",
+)
+_GAME_OVER_INSTRUCTIONS: Tuple[str, ...] = (
+    "Press SPACE to play again",
+    "Press H to view high scores",
+    "Press Q to quit",
+)
+_HIGH_SCORES_INSTRUCTIONS: Tuple[str, ...] = (
+    "Press SPACE to play again",
+    "Press ESC to return to splash screen",
+    "Press Q to quit",
+)
+_CONFIRM_RESET_INSTRUCTIONS: Tuple[str, ...] = (
+    "Press Y to confirm reset",
+    "Press N or ESC to cancel",
+)
+
+# High score colors by rank; lower ranks are white
+_RANK_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    GameConstants.YELLOW,
+    GameConstants.LIGHT_GRAY,
+    GameConstants.BROWN,
+    GameConstants.WHITE,
+    GameConstants.WHITE,
+)
+
+# Custom fruit sprites: decorative ones are drawn centered in a square of
+# this size, in-game ones in a cell with this much margin on every side
+_DECORATIVE_FRUIT_SPRITE_SIZE = 40
+_FRUIT_SPRITE_MARGIN = 5
+
+# Banana outline vertices relative to the fruit's center
+_BANANA_OFFSETS_DECORATIVE: Tuple[Tuple[int, int], ...] = (
+    (-10, 4),
+    (-8, -10),
+    (4, -8),
+    (12, 8),
+    (6, 10),
+    (-8, 8),
+)
+_BANANA_OFFSETS_CUSTOM: Tuple[Tuple[int, int], ...] = (
+    (-7, 3),
+    (-5, -7),
+    (1, -6),
+    (7, 5),
+    (4, 7),
+    (-4, 5),
+)
+
+# Peel dot offsets that fall inside the decorative and in-game oranges
+_ORANGE_DOTS_DECORATIVE: Tuple[Tuple[int, int], ...] = tuple(
+    (i * 4, j * 4)
+    for i in range(-2, 3)
+    for j in range(-2, 3)
+    if (i or j) and (i * 4) ** 2 + (j * 4) ** 2 <= 100
+)
+_ORANGE_DOTS_CUSTOM: Tuple[Tuple[int, int], ...] = tuple(
+    (i * 3, j * 3)
+    for i in range(-1, 2)
+    for j in range(-1, 2)
+    if (i or j) and (i * 3) ** 2 + (j * 3) ** 2 <= 49
+)
 
 
 class GameRenderer:
@@ -35,12 +160,69 @@ class GameRenderer:
         self.snake_head_renderer = SnakeHeadRenderer(screen)
         self.snake_scale_renderer = SnakeScaleRenderer(screen)
 
+        # Asset paths are resolved once rather than on every load
+        self._assets_dir = self._get_assets_directory()
+        self._splash_snake_path = os.path.join(
+            self._assets_dir, "perfect_coiled_snake_large.png"
+        )
+
         # Load fruit images (after pygame display is initialized)
         self.fruit_images: Dict[str, pygame.Surface] = {}
+        # Enlarged copies for the splash screen, scaled once at load time
+        self.fruit_images_splash: Dict[str, pygame.Surface] = {}
         self.use_images = False
         # Delay loading until first render to ensure pygame is fully initialized
         self._images_loaded = False
 
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache: Dict[
+            Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface
+        ] = {}
+        # Rendered text surfaces and their rects keyed by (font, text, color, center)
+        self._text_blit_cache: Dict[
+            Tuple[pygame.font.Font, str, Tuple[int, int, int], Tuple[int, int]],
+            Tuple[pygame.Surface, pygame.Rect],
+        ] = {}
+
+        # Identity of the static screen currently on the display, if any
+        self._static_screen_key: Optional[Hashable] = None
+
+        # UI bar chrome, and the values last drawn over it
+        self._ui_background: Optional[pygame.Surface] = None
+        self._ui_values: Optional[Tuple[int, int, int]] = None
+
+        # Custom fruit drawers by fruit name
+        self._custom_fruit_drawers: Dict[
+            str, Callable[[pygame.Surface, int, int, int, int], None]
+        ] = {
+            "apple": self._draw_custom_apple,
+            "pear": self._draw_custom_pear,
+            "banana": self._draw_custom_banana,
+            "cherry": self._draw_custom_cherry,
+            "orange": self._draw_custom_orange,
+        }
+        self._decorative_fruit_drawers: Dict[
+            str, Callable[[pygame.Surface, int, int], None]
+        ] = {
+            "apple": self._draw_decorative_apple,
+            "banana": self._draw_decorative_banana,
+            "cherry": self._draw_decorative_cherry,
+            "orange": self._draw_decorative_orange,
+            "pear": self._draw_decorative_pear,
+        }
+
+        # Custom-drawn fruit fallbacks, rendered once per fruit type
+        self._decorative_fruit_sprites: Dict[str, pygame.Surface] = {}
+        self._fruit_sprites: Dict[str, pygame.Surface] = {}
+
+        # Splash logo, scaled on first use (None if it could not be loaded)
+        self.splash_snake_scaled: Optional[pygame.Surface] = None
+        self._splash_snake_loaded = False
+
+        # Smoothed snake path and the segments it was built from
+        self._snake_path_segments: List[Tuple[int, int]] = []
+        self._snake_path_points: List[Tuple[int, int]] = []
+
     def _ensure_images_loaded(self):
         """Ensure fruit images are loaded (called on first render)."""
         if not self._images_loaded:
@@ -54,7 +236,7 @@ class GameRenderer:
             True if images were loaded successfully, False otherwise
         """
         try:
-            assets_dir = self._get_assets_directory()
+            assets_dir = self._assets_dir
             fruit_names = ["apple", "pear", "banana", "cherry", "orange"]
 
             loaded_count = 0
@@ -88,6 +270,10 @@ class GameRenderer:
             if os.path.exists(image_path):
                 image = pygame.image.load(image_path).convert_alpha()
                 self.fruit_images[fruit_name] = image
+                # 1.6x larger than game size for better visibility on the splash
+                self.fruit_images_splash[fruit_name] = pygame.transform.scale(
+                    image, (32, 32)
+                )
                 return True
             else:
                 print(f"Warning: Could not find {image_path}")
@@ -107,53 +293,128 @@ class GameRenderer:
         """
         return loaded_count > 0
 
-    def render_splash_screen(self):
-        """Render the splash screen."""
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from earlier frames.
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Bound the cache; changing scores would otherwise grow it forever
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = convert_alpha(font.render(text, True, color))
+            self._text_cache[key] = surface
+        return surface
+
+    def _render_text_centered(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, int, int],
+        center: Tuple[int, int],
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Render text centered on a point, reusing the surface and its rect.
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+            center: Screen position to center the text on
+
+        Returns:
+            Rendered text surface and its positioned rect, ready to blit
+        """
+        key = (font, text, color, center)
+        item = self._text_blit_cache.get(key)
+        if item is None:
+            if len(self._text_blit_cache) >= _TEXT_CACHE_SIZE:
+                self._text_blit_cache.clear()
+            surface = self._render_text(font, text, color)
+            item = (surface, surface.get_rect(center=center))
+            self._text_blit_cache[key] = item
+        return item
+
+    def _begin_static_screen(self, key: Hashable) -> bool:
+        """Prepare a static screen for drawing.
+
+        Static screens do not change between frames, so they are only cleared
+        and redrawn when first entered or when their content changes.
+
+        Args:
+            key: Value identifying the screen and the content it shows
+
+        Returns:
+            True if the screen needs to be drawn, False if it is already shown
+        """
+        if key == self._static_screen_key:
+            return False
+        self._static_screen_key = key
         self.screen.fill(GameConstants.BLACK)
+        return True
+
+    def render_splash_screen(self) -> List[Tuple[int, int, int, int]]:
+        """Render the splash screen.
+
+        Returns:
+            Areas of the window changed by this frame, for pygame.display.update
+        """
+        if not self._begin_static_screen("splash"):
+            return []
 
         # Draw splash graphics
         self._draw_splash_graphics()
 
         # Title with shadow effect
-        title_shadow = self.large_font.render(
-            "SNAKE GAME", True, GameConstants.DARK_GREEN
-        )
-        title_text = self.large_font.render("SNAKE GAME", True, GameConstants.GREEN)
-        title_rect = title_text.get_rect(center=(GameConstants.WINDOW_WIDTH // 2, 200))
-        shadow_rect = title_shadow.get_rect(
-            center=(GameConstants.WINDOW_WIDTH // 2 + 3, 203)
-        )
-        self.screen.blit(title_shadow, shadow_rect)
-        self.screen.blit(title_text, title_rect)
-
-        # Instructions
-        instructions = [
-            "Use arrow keys to control the snake",
-            "Eat different fruits to grow and score points",
-            "Avoid hitting walls and yourself",
-            "Each fruit gives 4 points and increases speed",
-            "",
-            "Press any key to start!",
-            "Press H to view high scores",
-            "Press Q to quit",
+        blit_sequence = [
+            self._render_text_centered(
+                self.large_font,
+                "SNAKE GAME",
+                GameConstants.DARK_GREEN,
+                (GameConstants.WINDOW_CENTER_X + 3, 203),
+            ),
+            self._render_text_centered(
+                self.large_font,
+                "SNAKE GAME",
+                GameConstants.GREEN,
+                (GameConstants.WINDOW_CENTER_X, 200),
+            ),
         ]
 
+        # Instructions
         y_offset = 280
-        for instruction in instructions:
+        for instruction in _SPLASH_INSTRUCTIONS:
             if instruction:  # Skip empty lines
                 color = (
                     GameConstants.YELLOW
                     if "Press" in instruction
                     else GameConstants.WHITE
                 )
-                text = self.small_font.render(instruction, True, color)
-                text_rect = text.get_rect(
-                    center=(GameConstants.WINDOW_WIDTH // 2, y_offset)
+                blit_sequence.append(
+                    self._render_text_centered(
+                        self.small_font,
+                        instruction,
+                        color,
+                        (GameConstants.WINDOW_CENTER_X, y_offset),
+                    )
                 )
-                self.screen.blit(text, text_rect)
             y_offset += 25
 
-    def render_game_screen(self, snake: Snake, fruit: Fruit, score: int, speed: int):
+        self.screen.blits(blit_sequence, doreturn=False)
+        return [_WINDOW_AREA]
+
+    def render_game_screen(
+        self, snake: Snake, fruit: Fruit, score: int, speed: int
+    ) -> List[Tuple[int, int, int, int]]:
         """Render the main game screen.
 
         Args:
@@ -161,11 +422,23 @@ class GameRenderer:
             fruit: Fruit object to render
             score: Current score
             speed: Current game speed
-        """
-        self.screen.fill(GameConstants.BLACK)
 
-        # Draw UI and border
-        self._draw_ui(score, snake.length, speed)
+        Returns:
+            Areas of the window changed by this frame, for pygame.display.update
+        """
+        # The window is only cleared when the game screen is first shown
+        entered = self._begin_static_screen("game")
+        dirty_areas = [_WINDOW_AREA] if entered else [_GAME_AREA]
+
+        # The UI bar is only redrawn when the values it shows change
+        ui_values = (score, snake.length, speed)
+        if entered or ui_values != self._ui_values:
+            self._ui_values = ui_values
+            self._draw_ui(score, snake.length, speed)
+            if not entered:
+                dirty_areas.append(_UI_AREA)
+
+        # Draw border
         self._draw_border()
 
         # Draw snake
@@ -174,194 +447,241 @@ class GameRenderer:
         # Draw fruit
         self._draw_fruit(fruit)
 
-    def render_game_over_screen(self, final_score: int, is_high_score: bool):
+        return dirty_areas
+
+    def render_game_over_screen(
+        self, final_score: int, is_high_score: bool
+    ) -> List[Tuple[int, int, int, int]]:
         """Render the game over screen.
 
         Args:
             final_score: The final score achieved
             is_high_score: Whether this is a new high score
+
+        Returns:
+            Areas of the window changed by this frame, for pygame.display.update
         """
-        self.screen.fill(GameConstants.BLACK)
+        # Everything except the pulsing title is drawn once per result
+        entered = self._begin_static_screen(("game_over", final_score, is_high_score))
+        if entered:
+            self._draw_game_over_static(final_score, is_high_score)
 
         # Game Over title with pulsing effect
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.3 + 0.7
-        red_color = (int(255 * pulse), 0, 0)
-
-        game_over_text = self.large_font.render("GAME OVER!", True, red_color)
-        game_over_rect = game_over_text.get_rect(
-            center=(GameConstants.WINDOW_WIDTH // 2, 150)
+        ticks = pygame.time.get_ticks() % _PULSE_PERIOD_MS
+        red_color = (_PULSE_REDS[ticks // _PULSE_STEP_MS], 0, 0)
+
+        game_over_text, game_over_rect = self._render_text_centered(
+            self.large_font,
+            "GAME OVER!",
+            red_color,
+            (GameConstants.WINDOW_CENTER_X, 150),
         )
+        # Only the title's area is cleared before drawing the new shade
+        self.screen.fill(GameConstants.BLACK, game_over_rect)
         self.screen.blit(game_over_text, game_over_rect)
+        return (
+            [_WINDOW_AREA]
+            if entered
+            else [(*game_over_rect.topleft, *game_over_rect.size)]
+        )
 
+    def _draw_game_over_static(self, final_score: int, is_high_score: bool):
+        """Draw the parts of the game over screen that do not animate.
+
+        Args:
+            final_score: The final score achieved
+            is_high_score: Whether this is a new high score
+        """
         # Final score
-        score_text = self.font.render(
-            f"Final Score: {final_score:,}", True, GameConstants.WHITE
-        )
-        score_rect = score_text.get_rect(center=(GameConstants.WINDOW_WIDTH // 2, 220))
-        self.screen.blit(score_text, score_rect)
+        blit_sequence = [
+            self._render_text_centered(
+                self.font,
+                f"Final Score: {final_score:,}",
+                GameConstants.WHITE,
+                (GameConstants.WINDOW_CENTER_X, 220),
+            )
+        ]
 
         # Check if it's a high score
         if is_high_score and final_score > 0:
-            high_score_text = self.font.render(
-                "NEW HIGH SCORE!", True, GameConstants.YELLOW
-            )
-            high_score_rect = high_score_text.get_rect(
-                center=(GameConstants.WINDOW_WIDTH // 2, 260)
+            blit_sequence.append(
+                self._render_text_centered(
+                    self.font,
+                    "NEW HIGH SCORE!",
+                    GameConstants.YELLOW,
+                    (GameConstants.WINDOW_CENTER_X, 260),
+                )
             )
-            self.screen.blit(high_score_text, high_score_rect)
 
         # Instructions
-        instructions = [
-            "Press SPACE to play again",
-            "Press H to view high scores",
-            "Press Q to quit",
-        ]
-
         y_offset = 320
-        for instruction in instructions:
-            text = self.small_font.render(instruction, True, GameConstants.WHITE)
-            text_rect = text.get_rect(
-                center=(GameConstants.WINDOW_WIDTH // 2, y_offset)
+        for instruction in _GAME_OVER_INSTRUCTIONS:
+            blit_sequence.append(
+                self._render_text_centered(
+                    self.small_font,
+                    instruction,
+                    GameConstants.WHITE,
+                    (GameConstants.WINDOW_CENTER_X, y_offset),
+                )
             )
-            self.screen.blit(text, text_rect)
             y_offset += 30
 
-    def render_high_scores_screen(self, high_scores: List[int]):
+        self.screen.blits(blit_sequence, doreturn=False)
+
+    def render_high_scores_screen(
+        self, high_scores: List[int]
+    ) -> List[Tuple[int, int, int, int]]:
         """Render the high scores screen.
 
         Args:
             high_scores: List of high scores to display
+
+        Returns:
+            Areas of the window changed by this frame, for pygame.display.update
         """
-        self.screen.fill(GameConstants.BLACK)
+        if not self._begin_static_screen(("high_scores", tuple(high_scores))):
+            return []
 
         # Title
-        title_text = self.large_font.render("HIGH SCORES", True, GameConstants.YELLOW)
-        title_rect = title_text.get_rect(center=(GameConstants.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title_text, title_rect)
+        blit_sequence = [
+            self._render_text_centered(
+                self.large_font,
+                "HIGH SCORES",
+                GameConstants.YELLOW,
+                (GameConstants.WINDOW_CENTER_X, 100),
+            )
+        ]
 
         # High scores with ranking colors
-        colors = [
-            GameConstants.YELLOW,
-            GameConstants.LIGHT_GRAY,
-            GameConstants.BROWN,
-            GameConstants.WHITE,
-            GameConstants.WHITE,
-        ]
         y_offset = 180
         for i, score in enumerate(high_scores):
-            color = colors[i] if i < len(colors) else GameConstants.WHITE
-            score_text = self.font.render(f"{i + 1}. {score:,}", True, color)
-            score_rect = score_text.get_rect(
-                center=(GameConstants.WINDOW_WIDTH // 2, y_offset)
+            color = _RANK_COLORS[i] if i < len(_RANK_COLORS) else GameConstants.WHITE
+            blit_sequence.append(
+                self._render_text_centered(
+                    self.font,
+                    f"{i + 1}. {score:,}",
+                    color,
+                    (GameConstants.WINDOW_CENTER_X, y_offset),
+                )
             )
-            self.screen.blit(score_text, score_rect)
             y_offset += 40
 
         # Instructions
-        instructions = [
-            "Press SPACE to play again",
-            "Press ESC to return to splash screen",
-            "Press Q to quit",
-        ]
-
         y_offset = 450
-        for instruction in instructions:
-            text = self.small_font.render(instruction, True, GameConstants.WHITE)
-            text_rect = text.get_rect(
-                center=(GameConstants.WINDOW_WIDTH // 2, y_offset)
+        for instruction in _HIGH_SCORES_INSTRUCTIONS:
+            blit_sequence.append(
+                self._render_text_centered(
+                    self.small_font,
+                    instruction,
+                    GameConstants.WHITE,
+                    (GameConstants.WINDOW_CENTER_X, y_offset),
+                )
             )
-            self.screen.blit(text, text_rect)
             y_offset += 25
 
-    def render_confirm_reset_screen(self):
-        """Render the confirmation screen for resetting high scores."""
-        self.screen.fill(GameConstants.BLACK)
+        self.screen.blits(blit_sequence, doreturn=False)
+        return [_WINDOW_AREA]
+
+    def render_confirm_reset_screen(self) -> List[Tuple[int, int, int, int]]:
+        """Render the confirmation screen for resetting high scores.
+
+        Returns:
+            Areas of the window changed by this frame, for pygame.display.update
+        """
+        if not self._begin_static_screen("confirm_reset"):
+            return []
 
         # Warning title
-        warning_text = self.large_font.render(
-            "RESET HIGH SCORES?", True, GameConstants.RED
-        )
-        warning_rect = warning_text.get_rect(
-            center=(GameConstants.WINDOW_WIDTH // 2, 200)
-        )
-        self.screen.blit(warning_text, warning_rect)
+        blit_sequence = [
+            self._render_text_centered(
+                self.large_font,
+                "RESET HIGH SCORES?",
+                GameConstants.RED,
+                (GameConstants.WINDOW_CENTER_X, 200),
+            )
+        ]
 
         # Confirmation message
-        confirm_text = self.font.render(
-            "This will reset all high scores to 0", True, GameConstants.WHITE
-        )
-        confirm_rect = confirm_text.get_rect(
-            center=(GameConstants.WINDOW_WIDTH // 2, 260)
+        blit_sequence.append(
+            self._render_text_centered(
+                self.font,
+                "This will reset all high scores to 0",
+                GameConstants.WHITE,
+                (GameConstants.WINDOW_CENTER_X, 260),
+            )
         )
-        self.screen.blit(confirm_text, confirm_rect)
 
         # Instructions
-        instructions = ["Press Y to confirm reset", "Press N or ESC to cancel"]
-
         y_offset = 320
-        for instruction in instructions:
+        for instruction in _CONFIRM_RESET_INSTRUCTIONS:
             color = (
                 GameConstants.RED
                 if "Y to confirm" in instruction
                 else GameConstants.WHITE
             )
-            text = self.font.render(instruction, True, color)
-            text_rect = text.get_rect(
-                center=(GameConstants.WINDOW_WIDTH // 2, y_offset)
+            blit_sequence.append(
+                self._render_text_centered(
+                    self.font,
+                    instruction,
+                    color,
+                    (GameConstants.WINDOW_CENTER_X, y_offset),
+                )
             )
-            self.screen.blit(text, text_rect)
             y_offset += 40
 
+        self.screen.blits(blit_sequence, doreturn=False)
+        return [_WINDOW_AREA]
+
     def _draw_splash_graphics(self):
         """Draw graphics for the splash screen using high-quality Twemoji images."""
         # Ensure images are loaded
         self._ensure_images_loaded()
 
         # Draw a single large snake logo as the main logo
-        center_x = GameConstants.WINDOW_WIDTH // 2
+        center_x = GameConstants.WINDOW_CENTER_X
         snake_y = 100
 
-        # Use the perfect coiled snake image
-        snake_path = os.path.join(
-            self._get_assets_directory(), "perfect_coiled_snake_large.png"
-        )
+        scaled_snake = self._get_splash_snake_image()
+        if scaled_snake is not None:
+            snake_rect = scaled_snake.get_rect()
+            snake_rect.center = (center_x, snake_y)
+            self.screen.blit(scaled_snake, snake_rect)
+        else:
+            # Fallback to custom drawn snake if the image is unavailable
+            self._draw_custom_snake_logo(center_x, snake_y)
+
+        # Draw high-quality Twemoji fruits around the screen (avoiding text
+        # areas). Image fruits are collected and drawn with a single blits call
+        blit_sequence: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        for x, y, fruit_type in _SPLASH_FRUITS:
+            self._draw_decorative_fruit_image(
+                x, y, fruit_type, blit_sequence=blit_sequence
+            )
+        if blit_sequence:
+            self.screen.blits(blit_sequence, doreturn=False)
 
+    def _get_splash_snake_image(self) -> Optional[pygame.Surface]:
+        """Get the splash snake logo, loading and scaling it on first use.
+
+        Returns:
+            The 128x128 snake logo, or None if the image is unavailable
+        """
+        if self._splash_snake_loaded:
+            return self.splash_snake_scaled
+        self._splash_snake_loaded = True
+
+        # Use the perfect coiled snake image
+        snake_path = self._splash_snake_path
         if os.path.exists(snake_path):
             try:
                 snake_image = pygame.image.load(snake_path).convert_alpha()
                 # Scale up the snake image to make it more prominent (128x128, about 33% larger)
-                scaled_snake = pygame.transform.scale(snake_image, (128, 128))
-                snake_rect = scaled_snake.get_rect()
-                snake_rect.center = (center_x, snake_y)
-                self.screen.blit(scaled_snake, snake_rect)
+                self.splash_snake_scaled = pygame.transform.scale(
+                    snake_image, (128, 128)
+                )
             except Exception as e:
                 print(f"Warning: Could not load perfect coiled snake: {e}")
-                # Fallback to custom drawn snake
-                self._draw_custom_snake_logo(center_x, snake_y)
-        else:
-            # Fallback to custom drawn snake if image not found
-            self._draw_custom_snake_logo(center_x, snake_y)
-
-        # Draw high-quality Twemoji fruits around the screen (avoiding text areas)
-        # Text areas: Title at y=200, Instructions from y=280 to y=480
-        # Safe areas: Top corners, sides, and bottom
-        fruits = [
-            # Top corners (above title)
-            (80, 150, FruitType.APPLE),
-            (GameConstants.WINDOW_WIDTH - 80, 140, FruitType.BANANA),
-            # Side areas (between title and instructions)
-            (60, 240, FruitType.CHERRY),
-            (GameConstants.WINDOW_WIDTH - 60, 250, FruitType.ORANGE),
-            # Bottom area (below instructions)
-            (center_x - 60, 520, FruitType.PEAR),
-            (center_x + 60, 510, FruitType.APPLE),
-            # Additional decorative fruits in safe areas
-            (120, 480, FruitType.BANANA),
-            (GameConstants.WINDOW_WIDTH - 120, 490, FruitType.CHERRY),
-        ]
-
-        for x, y, fruit_type in fruits:
-            self._draw_decorative_fruit_image(x, y, fruit_type)
+        return self.splash_snake_scaled
 
     def _draw_custom_snake_logo(self, center_x: int, center_y: int):
         """Draw a custom snake logo as fallback when emoji is not available.
@@ -371,11 +691,9 @@ class GameRenderer:
             center_y: Center Y position for the snake
         """
         # Draw a decorative snake
-        snake_points = []
-        for i in range(8):
-            x = center_x - 100 + i * 25
-            y = center_y + int(20 * math.sin(i * 0.5))
-            snake_points.append((x, y))
+        snake_points = [
+            (center_x + dx, center_y + dy) for dx, dy in _SPLASH_LOGO_OFFSETS
+        ]
 
         # Draw snake body
         for i, (x, y) in enumerate(snake_points):
@@ -392,108 +710,107 @@ class GameRenderer:
                 pygame.draw.circle(self.screen, GameConstants.BLACK, (x + 4, y - 3), 2)
                 pygame.draw.circle(self.screen, GameConstants.BLACK, (x + 4, y + 3), 2)
 
-    def _draw_decorative_fruit_image(self, x: int, y: int, fruit_type: FruitType):
+    def _draw_decorative_fruit_image(
+        self,
+        x: int,
+        y: int,
+        fruit_type: FruitType,
+        blit_sequence: Optional[List[Tuple[pygame.Surface, pygame.Rect]]] = None,
+    ):
         """Draw a decorative fruit using high-quality Twemoji images when available.
 
         Args:
             x: X position
             y: Y position
             fruit_type: Type of fruit to draw
+            blit_sequence: If given, the blit is appended here for the
+                caller to batch instead of being drawn immediately
         """
         name, primary_color, secondary_color = fruit_type.value
 
-        if self.use_images and name in self.fruit_images:
-            # Use high-quality Twemoji image, scaled up for splash screen
-            image = self.fruit_images[name]
-            # Scale up the image for better visibility on splash screen
-            scaled_image = pygame.transform.scale(
-                image, (32, 32)
-            )  # 1.6x larger than game size
+        if self.use_images and name in self.fruit_images_splash:
+            # Use high-quality Twemoji image, pre-scaled for splash screen
+            image = self.fruit_images_splash[name]
+        else:
+            # Fallback to enhanced custom graphics, drawn once into a sprite
+            sprite = self._decorative_fruit_sprites.get(name)
+            if sprite is None:
+                center = _DECORATIVE_FRUIT_SPRITE_SIZE // 2
+                sprite = render_sprite(
+                    _DECORATIVE_FRUIT_SPRITE_SIZE,
+                    lambda surface: self._draw_decorative_fruit_custom(
+                        surface, center, center, fruit_type
+                    ),
+                )
+                self._decorative_fruit_sprites[name] = sprite
+            image = sprite
 
-            # Center the image at the given position
-            image_rect = scaled_image.get_rect()
-            image_rect.center = (x, y)
+        # Center the image at the given position
+        image_rect = image.get_rect()
+        image_rect.center = (x, y)
 
-            self.screen.blit(scaled_image, image_rect)
+        if blit_sequence is None:
+            self.screen.blit(image, image_rect)
         else:
-            # Fallback to enhanced custom graphics
-            self._draw_decorative_fruit_custom(x, y, fruit_type)
+            blit_sequence.append((image, image_rect))
 
-    def _draw_decorative_fruit_custom(self, x: int, y: int, fruit_type: FruitType):
+    def _draw_decorative_fruit_custom(
+        self, surface: pygame.Surface, x: int, y: int, fruit_type: FruitType
+    ):
         """Draw a decorative fruit with enhanced custom graphics as fallback.
 
         Args:
+            surface: Surface to draw on
             x: X position
             y: Y position
             fruit_type: Type of fruit to draw
         """
         name, primary_color, secondary_color = fruit_type.value
 
-        fruit_drawers = {
-            "apple": self._draw_decorative_apple,
-            "banana": self._draw_decorative_banana,
-            "cherry": self._draw_decorative_cherry,
-            "orange": self._draw_decorative_orange,
-            "pear": self._draw_decorative_pear,
-        }
-
-        drawer = fruit_drawers.get(name)
+        drawer = self._decorative_fruit_drawers.get(name)
         if drawer:
-            drawer(x, y)
+            drawer(surface, x, y)
 
-    def _draw_decorative_apple(self, x: int, y: int):
+    def _draw_decorative_apple(self, surface: pygame.Surface, x: int, y: int):
         """Draw a decorative apple."""
-        pygame.draw.circle(self.screen, (220, 20, 20), (x, y + 2), 14)
-        pygame.draw.circle(self.screen, (255, 50, 50), (x - 3, y - 1), 10)
-        pygame.draw.rect(self.screen, (101, 67, 33), (x - 1, y - 10, 2, 6))
-        pygame.draw.ellipse(self.screen, (34, 139, 34), (x + 1, y - 10, 8, 4))
-        pygame.draw.circle(self.screen, (255, 200, 200), (x - 4, y - 3), 3)
+        pygame.draw.circle(surface, (220, 20, 20), (x, y + 2), 14)
+        pygame.draw.circle(surface, (255, 50, 50), (x - 3, y - 1), 10)
+        pygame.draw.rect(surface, (101, 67, 33), (x - 1, y - 10, 2, 6))
+        pygame.draw.ellipse(surface, (34, 139, 34), (x + 1, y - 10, 8, 4))
+        pygame.draw.circle(surface, (255, 200, 200), (x - 4, y - 3), 3)
 
-    def _draw_decorative_banana(self, x: int, y: int):
+    def _draw_decorative_banana(self, surface: pygame.Surface, x: int, y: int):
         """Draw a decorative banana."""
-        points = [
-            (x - 10, y + 4),
-            (x - 8, y - 10),
-            (x + 4, y - 8),
-            (x + 12, y + 8),
-            (x + 6, y + 10),
-            (x - 8, y + 8),
-        ]
-        pygame.draw.polygon(self.screen, (255, 255, 0), points)
-        pygame.draw.circle(self.screen, (101, 67, 33), (x - 8, y - 10), 3)
-        pygame.draw.line(self.screen, (200, 200, 0), (x - 6, y - 6), (x + 6, y + 4), 2)
+        points = [(x + dx, y + dy) for dx, dy in _BANANA_OFFSETS_DECORATIVE]
+        pygame.draw.polygon(surface, (255, 255, 0), points)
+        pygame.draw.circle(surface, (101, 67, 33), (x - 8, y - 10), 3)
+        pygame.draw.line(surface, (200, 200, 0), (x - 6, y - 6), (x + 6, y + 4), 2)
 
-    def _draw_decorative_cherry(self, x: int, y: int):
+    def _draw_decorative_cherry(self, surface: pygame.Surface, x: int, y: int):
         """Draw decorative cherries."""
-        pygame.draw.circle(self.screen, (139, 0, 0), (x - 5, y + 3), 9)
-        pygame.draw.circle(self.screen, (220, 20, 60), (x - 5, y + 3), 7)
-        pygame.draw.circle(self.screen, (139, 0, 0), (x + 5, y + 4), 9)
-        pygame.draw.circle(self.screen, (220, 20, 60), (x + 5, y + 4), 7)
-        pygame.draw.line(self.screen, (34, 139, 34), (x - 5, y - 6), (x - 2, y - 12), 3)
-        pygame.draw.line(self.screen, (34, 139, 34), (x + 5, y - 5), (x + 2, y - 12), 3)
-        pygame.draw.circle(self.screen, (255, 100, 100), (x - 7, y + 1), 3)
-        pygame.draw.circle(self.screen, (255, 100, 100), (x + 3, y + 2), 3)
-
-    def _draw_decorative_orange(self, x: int, y: int):
+        pygame.draw.circle(surface, (139, 0, 0), (x - 5, y + 3), 9)
+        pygame.draw.circle(surface, (220, 20, 60), (x - 5, y + 3), 7)
+        pygame.draw.circle(surface, (139, 0, 0), (x + 5, y + 4), 9)
+        pygame.draw.circle(surface, (220, 20, 60), (x + 5, y + 4), 7)
+        pygame.draw.line(surface, (34, 139, 34), (x - 5, y - 6), (x - 2, y - 12), 3)
+        pygame.draw.line(surface, (34, 139, 34), (x + 5, y - 5), (x + 2, y - 12), 3)
+        pygame.draw.circle(surface, (255, 100, 100), (x - 7, y + 1), 3)
+        pygame.draw.circle(surface, (255, 100, 100), (x + 3, y + 2), 3)
+
+    def _draw_decorative_orange(self, surface: pygame.Surface, x: int, y: int):
         """Draw a decorative orange."""
-        pygame.draw.circle(self.screen, (255, 140, 0), (x, y), 14)
-        pygame.draw.circle(self.screen, (255, 165, 0), (x - 2, y - 2), 10)
-        for i in range(-2, 3):
-            for j in range(-2, 3):
-                if i == 0 and j == 0:
-                    continue
-                dot_x = x + i * 4
-                dot_y = y + j * 4
-                if (dot_x - x) ** 2 + (dot_y - y) ** 2 <= 100:
-                    pygame.draw.circle(self.screen, (200, 100, 0), (dot_x, dot_y), 1)
-        pygame.draw.circle(self.screen, (34, 139, 34), (x, y - 12), 3)
-
-    def _draw_decorative_pear(self, x: int, y: int):
+        pygame.draw.circle(surface, (255, 140, 0), (x, y), 14)
+        pygame.draw.circle(surface, (255, 165, 0), (x - 2, y - 2), 10)
+        for dx, dy in _ORANGE_DOTS_DECORATIVE:
+            pygame.draw.circle(surface, (200, 100, 0), (x + dx, y + dy), 1)
+        pygame.draw.circle(surface, (34, 139, 34), (x, y - 12), 3)
+
+    def _draw_decorative_pear(self, surface: pygame.Surface, x: int, y: int):
         """Draw a decorative pear."""
-        pygame.draw.circle(self.screen, (255, 255, 100), (x, y + 5), 10)
-        pygame.draw.circle(self.screen, (200, 255, 100), (x, y - 2), 7)
-        pygame.draw.rect(self.screen, (101, 67, 33), (x - 1, y - 12, 2, 6))
-        pygame.draw.circle(self.screen, (255, 255, 200), (x - 3, y), 3)
+        pygame.draw.circle(surface, (255, 255, 100), (x, y + 5), 10)
+        pygame.draw.circle(surface, (200, 255, 100), (x, y - 2), 7)
+        pygame.draw.rect(surface, (101, 67, 33), (x - 1, y - 12, 2, 6))
+        pygame.draw.circle(surface, (255, 255, 200), (x - 3, y), 3)
 
     def _draw_ui(self, score: int, length: int, speed: int):
         """Draw the UI area with score and length.
@@ -504,17 +821,8 @@ class GameRenderer:
             speed: Current speed
         """
         # UI background
-        ui_rect = pygame.Rect(0, 0, GameConstants.WINDOW_WIDTH, GameConstants.UI_HEIGHT)
-        pygame.draw.rect(self.screen, GameConstants.GRAY, ui_rect)
-        pygame.draw.rect(self.screen, GameConstants.WHITE, ui_rect, 2)
-
-        # Score
-        score_text = self.font.render(f"Score: {score:,}", True, GameConstants.WHITE)
-        self.screen.blit(score_text, (10, 15))
-
-        # Length
-        length_text = self.font.render(f"Length: {length}", True, GameConstants.WHITE)
-        self.screen.blit(length_text, (200, 15))
+        if self._ui_background is None:
+            self._ui_background = self._create_ui_background()
 
         # Speed indicator
         speed_percent = max(
@@ -526,38 +834,52 @@ class GameRenderer:
                 * 100
             ),
         )
-        speed_text = self.small_font.render(
-            f"Speed: {speed_percent}%", True, GameConstants.WHITE
+
+        # Background, score, length, speed and quit instruction in one call
+        render_text = self._render_text
+        white = GameConstants.WHITE
+        self.screen.blits(
+            (
+                (self._ui_background, (0, 0)),
+                (render_text(self.font, f"Score: {score:,}", white), (10, 15)),
+                (render_text(self.font, f"Length: {length}", white), (200, 15)),
+                (
+                    render_text(self.small_font, f"Speed: {speed_percent}%", white),
+                    (400, 20),
+                ),
+                (
+                    render_text(
+                        self.small_font, "Press Q to quit", GameConstants.LIGHT_GRAY
+                    ),
+                    (GameConstants.WINDOW_WIDTH - 120, 20),
+                ),
+            ),
+            doreturn=False,
         )
-        self.screen.blit(speed_text, (400, 20))
 
-        # Quit instruction
-        quit_text = self.small_font.render(
-            "Press Q to quit", True, GameConstants.LIGHT_GRAY
+    def _create_ui_background(self) -> pygame.Surface:
+        """Create the UI bar background and outline.
+
+        Returns:
+            Surface holding the bar chrome
+        """
+        background = pygame.Surface(
+            (GameConstants.WINDOW_WIDTH, GameConstants.UI_HEIGHT)
         )
-        self.screen.blit(quit_text, (GameConstants.WINDOW_WIDTH - 120, 20))
+        ui_rect = background.get_rect()
+        pygame.draw.rect(background, GameConstants.GRAY, ui_rect)
+        pygame.draw.rect(background, GameConstants.WHITE, ui_rect, 2)
+        return convert(background)
 
     def _draw_border(self):
         """Draw the game border."""
         # Outer border
-        border_rect = pygame.Rect(
-            0,
-            GameConstants.UI_HEIGHT,
-            GameConstants.WINDOW_WIDTH,
-            GameConstants.PLAY_AREA_HEIGHT + GameConstants.BORDER_WIDTH * 2,
-        )
         pygame.draw.rect(
-            self.screen, GameConstants.BROWN, border_rect, GameConstants.BORDER_WIDTH
+            self.screen, GameConstants.BROWN, _GAME_AREA, GameConstants.BORDER_WIDTH
         )
 
         # Inner playing area background
-        play_rect = pygame.Rect(
-            GameConstants.PLAY_AREA_X,
-            GameConstants.PLAY_AREA_Y,
-            GameConstants.PLAY_AREA_WIDTH,
-            GameConstants.PLAY_AREA_HEIGHT,
-        )
-        pygame.draw.rect(self.screen, GameConstants.BLACK, play_rect)
+        pygame.draw.rect(self.screen, GameConstants.BLACK, _PLAY_AREA)
 
     def _draw_snake(self, snake: Snake):
         """Draw the snake using component renderers for clean separation of concerns.
@@ -572,14 +894,25 @@ class GameRenderer:
                 self.snake_head_renderer.draw_head(head_x, head_y, snake.direction)
             return
 
-        # Convert grid positions to screen coordinates
-        screen_points = PathSmoother.convert_segments_to_screen_points(snake.segments)
-
-        # Create smooth path points for the snake body
-        smooth_points = PathSmoother.create_smooth_path(screen_points)
+        # The snake only moves every few frames, so the converted and smoothed
+        # path is kept until its segments change
+        if snake.segments != self._snake_path_segments:
+            # Convert grid positions to screen coordinates and smooth them
+            self._snake_path_points = PathSmoother.create_smooth_segment_path(
+                snake.segments
+            )
+            self._snake_path_segments = list(snake.segments)
+        smooth_points = self._snake_path_points
 
-        # Draw the continuous snake body using component renderer
-        self.snake_body_renderer.draw_body(smooth_points, snake.segments)
+        # The body is only drawing primitives, so the screen is locked once
+        # around it instead of once per primitive. The scales and head are
+        # blitted and must be drawn with the screen unlocked.
+        self.screen.lock()
+        try:
+            # Draw the continuous snake body using component renderer
+            self.snake_body_renderer.draw_body(smooth_points, snake.segments)
+        finally:
+            self.screen.unlock()
 
         # Add scale patterns using component renderer
         self.snake_scale_renderer.draw_scales(smooth_points)
@@ -609,83 +942,94 @@ class GameRenderer:
             # Center the image in the cell
             image_rect = image.get_rect()
             image_rect.center = (
-                screen_x + GameConstants.CELL_SIZE // 2,
-                screen_y + GameConstants.CELL_SIZE // 2,
+                screen_x + GameConstants.HALF_CELL,
+                screen_y + GameConstants.HALF_CELL,
             )
             self.screen.blit(image, image_rect)
         else:
-            # Fallback to custom graphics
-            self._draw_fruit_custom(screen_x, screen_y, fruit)
+            # Fallback to custom graphics, drawn once into a sprite
+            sprite = self._fruit_sprites.get(fruit_name)
+            if sprite is None:
+                sprite = render_sprite(
+                    GameConstants.CELL_SIZE + 2 * _FRUIT_SPRITE_MARGIN,
+                    lambda surface: self._draw_fruit_custom(
+                        surface, _FRUIT_SPRITE_MARGIN, _FRUIT_SPRITE_MARGIN, fruit
+                    ),
+                )
+                self._fruit_sprites[fruit_name] = sprite
+            self.screen.blit(
+                sprite,
+                (screen_x - _FRUIT_SPRITE_MARGIN, screen_y - _FRUIT_SPRITE_MARGIN),
+            )
 
-    def _draw_fruit_custom(self, screen_x: int, screen_y: int, fruit: Fruit):
+    def _draw_fruit_custom(
+        self, surface: pygame.Surface, screen_x: int, screen_y: int, fruit: Fruit
+    ):
         """Draw fruit using custom graphics as fallback.
 
         Args:
+            surface: Surface to draw on
             screen_x: Screen X position
             screen_y: Screen Y position
             fruit: Fruit object
         """
-        center_x = screen_x + GameConstants.CELL_SIZE // 2
-        center_y = screen_y + GameConstants.CELL_SIZE // 2
-
-        fruit_drawers = {
-            "apple": self._draw_custom_apple,
-            "pear": self._draw_custom_pear,
-            "banana": self._draw_custom_banana,
-            "cherry": self._draw_custom_cherry,
-            "orange": self._draw_custom_orange,
-        }
+        center_x = screen_x + GameConstants.HALF_CELL
+        center_y = screen_y + GameConstants.HALF_CELL
 
-        drawer = fruit_drawers.get(fruit.name)
+        drawer = self._custom_fruit_drawers.get(fruit.name)
         if drawer:
-            drawer(center_x, center_y, screen_x, screen_y)
+            drawer(surface, center_x, center_y, screen_x, screen_y)
 
     def _draw_custom_apple(
-        self, center_x: int, center_y: int, screen_x: int, screen_y: int
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        screen_x: int,
+        screen_y: int,
     ):
         """Draw a custom apple."""
-        pygame.draw.circle(self.screen, (220, 20, 20), (center_x, center_y + 1), 9)
-        pygame.draw.circle(self.screen, (255, 50, 50), (center_x - 2, center_y - 1), 7)
-        pygame.draw.rect(self.screen, (101, 67, 33), (center_x - 1, screen_y + 3, 2, 5))
-        pygame.draw.ellipse(
-            self.screen, (34, 139, 34), (center_x + 1, screen_y + 3, 6, 3)
-        )
-        pygame.draw.circle(
-            self.screen, (255, 200, 200), (center_x - 3, center_y - 2), 2
-        )
+        pygame.draw.circle(surface, (220, 20, 20), (center_x, center_y + 1), 9)
+        pygame.draw.circle(surface, (255, 50, 50), (center_x - 2, center_y - 1), 7)
+        pygame.draw.rect(surface, (101, 67, 33), (center_x - 1, screen_y + 3, 2, 5))
+        pygame.draw.ellipse(surface, (34, 139, 34), (center_x + 1, screen_y + 3, 6, 3))
+        pygame.draw.circle(surface, (255, 200, 200), (center_x - 3, center_y - 2), 2)
 
     def _draw_custom_pear(
-        self, center_x: int, center_y: int, screen_x: int, screen_y: int
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        screen_x: int,
+        screen_y: int,
     ):
         """Draw a custom pear."""
-        pygame.draw.circle(self.screen, (255, 255, 100), (center_x, center_y + 3), 7)
-        pygame.draw.circle(self.screen, (200, 255, 100), (center_x, center_y - 1), 5)
-        pygame.draw.rect(self.screen, (101, 67, 33), (center_x - 1, screen_y + 3, 2, 4))
-        pygame.draw.circle(self.screen, (255, 255, 200), (center_x - 2, center_y), 2)
+        pygame.draw.circle(surface, (255, 255, 100), (center_x, center_y + 3), 7)
+        pygame.draw.circle(surface, (200, 255, 100), (center_x, center_y - 1), 5)
+        pygame.draw.rect(surface, (101, 67, 33), (center_x - 1, screen_y + 3, 2, 4))
+        pygame.draw.circle(surface, (255, 255, 200), (center_x - 2, center_y), 2)
 
     def _draw_custom_banana(
-        self, center_x: int, center_y: int, screen_x: int, screen_y: int
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        screen_x: int,
+        screen_y: int,
     ):
         """Draw a custom banana."""
-        points = [
-            (center_x - 7, center_y + 3),
-            (center_x - 5, center_y - 7),
-            (center_x + 1, center_y - 6),
-            (center_x + 7, center_y + 5),
-            (center_x + 4, center_y + 7),
-            (center_x - 4, center_y + 5),
-        ]
-        pygame.draw.polygon(self.screen, (255, 255, 0), points)
-        pygame.draw.circle(self.screen, (101, 67, 33), (center_x - 5, center_y - 7), 2)
+        points = [(center_x + dx, center_y + dy) for dx, dy in _BANANA_OFFSETS_CUSTOM]
+        pygame.draw.polygon(surface, (255, 255, 0), points)
+        pygame.draw.circle(surface, (101, 67, 33), (center_x - 5, center_y - 7), 2)
         pygame.draw.line(
-            self.screen,
+            surface,
             (200, 200, 0),
             (center_x - 4, center_y - 4),
             (center_x + 3, center_y + 3),
             1,
         )
         pygame.draw.line(
-            self.screen,
+            surface,
             (200, 200, 0),
             (center_x - 2, center_y - 5),
             (center_x + 5, center_y + 2),
@@ -693,46 +1037,48 @@ class GameRenderer:
         )
 
     def _draw_custom_cherry(
-        self, center_x: int, center_y: int, screen_x: int, screen_y: int
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        screen_x: int,
+        screen_y: int,
     ):
         """Draw custom cherries."""
-        pygame.draw.circle(self.screen, (139, 0, 0), (center_x - 3, center_y + 2), 6)
-        pygame.draw.circle(self.screen, (220, 20, 60), (center_x - 3, center_y + 2), 5)
-        pygame.draw.circle(self.screen, (139, 0, 0), (center_x + 3, center_y + 3), 6)
-        pygame.draw.circle(self.screen, (220, 20, 60), (center_x + 3, center_y + 3), 5)
+        pygame.draw.circle(surface, (139, 0, 0), (center_x - 3, center_y + 2), 6)
+        pygame.draw.circle(surface, (220, 20, 60), (center_x - 3, center_y + 2), 5)
+        pygame.draw.circle(surface, (139, 0, 0), (center_x + 3, center_y + 3), 6)
+        pygame.draw.circle(surface, (220, 20, 60), (center_x + 3, center_y + 3), 5)
         pygame.draw.line(
-            self.screen,
+            surface,
             (34, 139, 34),
             (center_x - 3, center_y - 4),
             (center_x - 1, center_y - 7),
             2,
         )
         pygame.draw.line(
-            self.screen,
+            surface,
             (34, 139, 34),
             (center_x + 3, center_y - 3),
             (center_x + 1, center_y - 7),
             2,
         )
-        pygame.draw.circle(
-            self.screen, (255, 100, 100), (center_x - 4, center_y + 1), 2
-        )
-        pygame.draw.circle(
-            self.screen, (255, 100, 100), (center_x + 2, center_y + 2), 2
-        )
+        pygame.draw.circle(surface, (255, 100, 100), (center_x - 4, center_y + 1), 2)
+        pygame.draw.circle(surface, (255, 100, 100), (center_x + 2, center_y + 2), 2)
 
     def _draw_custom_orange(
-        self, center_x: int, center_y: int, screen_x: int, screen_y: int
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        screen_x: int,
+        screen_y: int,
     ):
         """Draw a custom orange."""
-        pygame.draw.circle(self.screen, (255, 140, 0), (center_x, center_y), 9)
-        pygame.draw.circle(self.screen, (255, 165, 0), (center_x - 1, center_y - 1), 7)
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if i == 0 and j == 0:
-                    continue
-                dot_x = center_x + i * 3
-                dot_y = center_y + j * 3
-                if (dot_x - center_x) ** 2 + (dot_y - center_y) ** 2 <= 49:
-                    pygame.draw.circle(self.screen, (200, 100, 0), (dot_x, dot_y), 1)
-        pygame.draw.circle(self.screen, (34, 139, 34), (center_x, center_y - 8), 2)
+        pygame.draw.circle(surface, (255, 140, 0), (center_x, center_y), 9)
+        pygame.draw.circle(surface, (255, 165, 0), (center_x - 1, center_y - 1), 7)
+        for dx, dy in _ORANGE_DOTS_CUSTOM:
+            pygame.draw.circle(
+                surface, (200, 100, 0), (center_x + dx, center_y + dy), 1
+            )
+        pygame.draw.circle(surface, (34, 139, 34), (center_x, center_y - 8), 2)
@@ -1,12 +1,68 @@
 """Snake rendering components with proper separation of concerns."""
 
 import math
-from typing import List, Tuple, TypedDict
+from typing import Dict, List, Optional, Tuple, TypedDict
 
 import pygame
 
 from snake_game.models import Direction
 from snake_game.utils import GameConstants
+from snake_game.views.surfaces import convert_alpha, render_sprite
+
+# Pixel offsets of the copies that make up a blurred shadow line
+_BLUR_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+)
+
+# Half the size of the cached head sprite, enough for the head layers and eyes
+_HEAD_SPRITE_RADIUS = 16
+
+# Half the size of the cached nostril sprite
+_NOSTRIL_SPRITE_RADIUS = 12
+
+# Half the size of the canvas the tongue sprites are cropped from
+_TONGUE_SPRITE_RADIUS = 21
+
+# Maximum number of smoothed path segments drawn as one polyline band
+_BODY_BAND_SEGMENTS = 4
+
+
+def _is_striped(segment_index: int) -> bool:
+    """Return whether the body segment at ``segment_index`` is a dark stripe."""
+    return math.sin(segment_index * 0.4) > 0.3
+
+
+def _drop_collinear_points(points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Drop interior points that lie on the straight line through their neighbours.
+
+    The snake moves on a grid, so most of its smoothed path is straight runs;
+    only the end points of a run and the points at a bend change what a
+    polyline draws. Repeated points are dropped as well.
+
+    Args:
+        points: Polyline points (x, y)
+
+    Returns:
+        The points that start, end or bend the polyline
+    """
+    kept = [points[0]]
+    for i in range(1, len(points) - 1):
+        prev_x, prev_y = points[i - 1]
+        x, y = points[i]
+        next_x, next_y = points[i + 1]
+        dx1, dy1 = x - prev_x, y - prev_y
+        dx2, dy2 = next_x - x, next_y - y
+        if dx1 * dy2 != dy1 * dx2 or dx1 * dx2 + dy1 * dy2 < 0:
+            kept.append(points[i])
+    kept.append(points[-1])
+    return kept
 
 
 class HeadLayer(TypedDict):
@@ -34,17 +90,48 @@ class SnakeBodyRenderer:
         if len(points) < 2:
             return
 
-        # Draw the snake body with proper proportions and green stripes
-        for i in range(len(points) - 1):
-            start_point = points[i]
-            end_point = points[i + 1]
-
-            # Calculate proper body proportions
-            progress = i / max(1, len(points) - 1)
-            thickness = self._calculate_thickness(progress)
-
-            # Draw enhanced segment with proper proportions and stripes
-            self._draw_striped_segment(start_point, end_point, thickness, progress, i)
+        # Bound once; this loop runs for every band of the smoothed path
+        calculate_thickness = self._calculate_thickness
+        draw_striped_band = self._draw_striped_band
+        last_index = len(points) - 1
+
+        # Draw the body as short polyline bands so each shading layer costs one
+        # draw call per band instead of one per smoothed point.  A band never
+        # spans a stripe boundary, so the stripe pattern stays crisp.
+        band_starts = []
+        band_start = 0
+        while band_start < last_index:
+            band_starts.append(band_start)
+            stripe = _is_striped(band_start)
+            band_end = min(band_start + _BODY_BAND_SEGMENTS, last_index)
+            for i in range(band_start + 1, band_end):
+                if _is_striped(i) != stripe:
+                    band_end = i
+                    break
+            band_start = band_end
+        band_starts.append(last_index)
+
+        # Calculate proper body proportions
+        progresses = [start / max(1, last_index) for start in band_starts]
+        thicknesses = [calculate_thickness(progress) for progress in progresses]
+
+        for band in range(len(band_starts) - 1):
+            band_start = band_starts[band]
+            band_end = band_starts[band + 1]
+            thickness = thicknesses[band]
+
+            # The next band draws its start caps over this joint; when it has
+            # the same thickness they cover this band's end caps exactly
+            end_caps = band_end == last_index or thicknesses[band + 1] != thickness
+
+            # Draw enhanced band with proper proportions and stripes
+            draw_striped_band(
+                points[band_start : band_end + 1],
+                thickness,
+                progresses[band],
+                band_start,
+                end_caps,
+            )
 
     def _calculate_thickness(self, progress: float) -> int:
         """Calculate body thickness based on position along snake.
@@ -70,29 +157,25 @@ class SnakeBodyRenderer:
         base_thickness = 16  # Base thickness
         return max(4, int(base_thickness * thickness_factor))
 
-    def _draw_striped_segment(
+    def _draw_striped_band(
         self,
-        start_point: Tuple[int, int],
-        end_point: Tuple[int, int],
+        band_points: List[Tuple[int, int]],
         thickness: int,
         progress: float,
         segment_index: int,
+        end_caps: bool = True,
     ):
-        """Draw a single segment with green coloring and stripe patterns.
+        """Draw a run of path points with green coloring and stripe patterns.
 
         Args:
-            start_point: Starting point (x, y)
-            end_point: Ending point (x, y)
-            thickness: Segment thickness
+            band_points: Consecutive smoothed path points (x, y)
+            thickness: Band thickness
             progress: Position along snake (0=head, 1=tail)
-            segment_index: Index for stripe patterns
+            segment_index: Index of the band's first segment, for stripe patterns
+            end_caps: Whether to round off the band's last point
         """
-        # Calculate segment direction
-        dx = end_point[0] - start_point[0]
-        dy = end_point[1] - start_point[1]
-        length = math.sqrt(dx * dx + dy * dy)
-
-        if length == 0:
+        band_points = _drop_collinear_points(band_points)
+        if len(band_points) == 2 and band_points[0] == band_points[1]:
             return
 
         # Enhanced green coloration with shimmer
@@ -109,7 +192,7 @@ class SnakeBodyRenderer:
         shimmer_intensity = (primary_shimmer * secondary_shimmer) * base_intensity
 
         # Stripe pattern
-        stripe_pattern = math.sin(segment_index * 0.4) > 0.3
+        stripe_pattern = _is_striped(segment_index)
         stripe_intensity = 0.7 if stripe_pattern else 1.0
 
         # Create shading layers
@@ -117,31 +200,29 @@ class SnakeBodyRenderer:
             base_intensity, shimmer_intensity, stripe_intensity
         )
 
+        # Calculate offset
+        offset_scale = min(1.0, thickness / 16.0)
+        offset_distance = thickness * 0.08 * offset_scale
+
         # Draw each shading layer
         for layer in shading_layers:
             layer_thickness = max(1, int(thickness * layer["thickness_mult"]))
 
-            # Calculate offset
-            offset_scale = min(1.0, thickness / 16.0)
-            offset_distance = thickness * 0.08 * offset_scale
-
             offset_x = layer["offset"][0] * offset_distance
             offset_y = layer["offset"][1] * offset_distance
 
-            offset_start = (
-                int(start_point[0] + offset_x),
-                int(start_point[1] + offset_y),
-            )
-            offset_end = (int(end_point[0] + offset_x), int(end_point[1] + offset_y))
+            offset_points = [
+                (int(x + offset_x), int(y + offset_y)) for x, y in band_points
+            ]
 
             # Draw the layer
             if layer.get("blur", False):
-                self._draw_blurred_line(
-                    offset_start, offset_end, layer["color"], layer_thickness
+                self._draw_blurred_polyline(
+                    offset_points, layer["color"], layer_thickness, end_caps
                 )
             else:
-                self._draw_ultra_smooth_line(
-                    offset_start, offset_end, layer["color"], layer_thickness
+                self._draw_ultra_smooth_polyline(
+                    offset_points, layer["color"], layer_thickness, end_caps
                 )
 
     def _create_shading_layers(
@@ -263,97 +344,98 @@ class SnakeBodyRenderer:
             },
         ]
 
-    def _draw_blurred_line(
+    def _draw_blurred_polyline(
         self,
-        start_point: Tuple[int, int],
-        end_point: Tuple[int, int],
+        points: List[Tuple[int, int]],
         color: Tuple[int, int, int],
         thickness: int,
+        end_caps: bool = True,
     ):
-        """Draw a blurred line for shadow effects.
+        """Draw a blurred polyline for shadow effects.
 
         Args:
-            start_point: Starting point (x, y)
-            end_point: Ending point (x, y)
+            points: Polyline points (x, y)
             color: Line color
             thickness: Line thickness
+            end_caps: Whether to round off the last point
         """
         if thickness <= 0:
             return
 
-        # Create multiple offset lines for blur effect
-        blur_offsets = [
-            (-1, -1),
-            (0, -1),
-            (1, -1),
-            (-1, 0),
-            (1, 0),
-            (-1, 1),
-            (0, 1),
-            (1, 1),
-        ]
         blur_color = tuple(c // 2 for c in color[:3])
 
-        # Draw blur layers
-        for offset_x, offset_y in blur_offsets:
-            blur_start = (start_point[0] + offset_x, start_point[1] + offset_y)
-            blur_end = (end_point[0] + offset_x, end_point[1] + offset_y)
-
-            if thickness > 1:
-                pygame.draw.line(
-                    self.screen, blur_color, blur_start, blur_end, max(1, thickness - 1)
+        # Draw blur layers, as multiple offset polylines
+        if thickness > 1:
+            draw_lines = pygame.draw.lines
+            screen = self.screen
+            blur_thickness = max(1, thickness - 1)
+            for offset_x, offset_y in _BLUR_OFFSETS:
+                draw_lines(
+                    screen,
+                    blur_color,
+                    False,
+                    [(x + offset_x, y + offset_y) for x, y in points],
+                    blur_thickness,
                 )
 
         # Draw main line
-        self._draw_ultra_smooth_line(start_point, end_point, color, thickness)
+        self._draw_ultra_smooth_polyline(points, color, thickness, end_caps)
 
-    def _draw_ultra_smooth_line(
+    def _draw_ultra_smooth_polyline(
         self,
-        start_point: Tuple[int, int],
-        end_point: Tuple[int, int],
+        points: List[Tuple[int, int]],
         color: Tuple[int, int, int],
         thickness: int,
+        end_caps: bool = True,
     ):
-        """Draw an ultra-smooth thick line with perfect anti-aliasing.
+        """Draw an ultra-smooth thick polyline with rounded ends.
 
         Args:
-            start_point: Starting point (x, y)
-            end_point: Ending point (x, y)
+            points: Polyline points (x, y)
             color: Line color
             thickness: Line thickness
+            end_caps: Whether to round off the last point as well as the first
         """
         if thickness <= 0:
             return
 
+        draw_lines = pygame.draw.lines
+        draw_circle = pygame.draw.circle
+        screen = self.screen
+        start_point = points[0]
+        end_point = points[-1]
+
         # For very smooth lines, draw multiple thin lines with slight offsets
         if thickness > 4:
             # Draw main thick line
-            pygame.draw.line(self.screen, color, start_point, end_point, thickness)
+            draw_lines(screen, color, False, points, thickness)
 
             # Add anti-aliasing by drawing thinner lines around the edges
             edge_color = tuple(min(255, c + 20) for c in color[:3])
-            pygame.draw.line(
-                self.screen, edge_color, start_point, end_point, max(1, thickness - 2)
-            )
+            draw_lines(screen, edge_color, False, points, max(1, thickness - 2))
 
-            # Draw perfect rounded end caps
+            # Draw perfect rounded end caps; bands share their end points, so
+            # this also rounds the joints between neighbouring bands
             radius = thickness // 2
             if radius > 0:
                 # Main caps
-                pygame.draw.circle(self.screen, color, start_point, radius)
-                pygame.draw.circle(self.screen, color, end_point, radius)
+                draw_circle(screen, color, start_point, radius)
+                if end_caps:
+                    draw_circle(screen, color, end_point, radius)
 
                 # Anti-aliased edge caps
                 if radius > 2:
-                    pygame.draw.circle(self.screen, edge_color, start_point, radius - 1)
-                    pygame.draw.circle(self.screen, edge_color, end_point, radius - 1)
+                    draw_circle(screen, edge_color, start_point, radius - 1)
+                    if end_caps:
+                        draw_circle(screen, edge_color, end_point, radius - 1)
         else:
             # For thin lines, just draw normally
-            pygame.draw.line(self.screen, color, start_point, end_point, thickness)
+            draw_lines(screen, color, False, points, thickness)
             if thickness > 1:
                 radius = thickness // 2
-                pygame.draw.circle(self.screen, color, start_point, radius)
-                pygame.draw.circle(self.screen, color, end_point, radius)
+                draw_circle(screen, color, start_point, radius)
+                if end_caps:
+                    draw_circle(screen, color, end_point, radius)
 
 
 class SnakeHeadRenderer:
@@ -362,6 +444,16 @@ class SnakeHeadRenderer:
     def __init__(self, screen: pygame.Surface):
         """Initialize the head renderer."""
         self.screen = screen
+        # Head layers and eyes by direction and shimmer colors; the shimmer
+        # only ever produces a few hundred distinct color sets
+        self._head_sprites: Dict[
+            Tuple[Direction, Tuple[Tuple[int, int, int], ...]], pygame.Surface
+        ] = {}
+        self._nostril_sprites: Dict[Direction, pygame.Surface] = {}
+        # Tongue sprites with their offset from the head center
+        self._tongue_sprites: Dict[
+            Direction, Tuple[pygame.Surface, Tuple[int, int]]
+        ] = {}
 
     def draw_head(self, x: int, y: int, direction: Direction):
         """Draw a realistic elongated snake head.
@@ -373,9 +465,78 @@ class SnakeHeadRenderer:
         """
         screen_x = GameConstants.PLAY_AREA_X + x * GameConstants.CELL_SIZE
         screen_y = GameConstants.PLAY_AREA_Y + y * GameConstants.CELL_SIZE
-        center_x = screen_x + GameConstants.CELL_SIZE // 2
-        center_y = screen_y + GameConstants.CELL_SIZE // 2
+        center_x = screen_x + GameConstants.HALF_CELL
+        center_y = screen_y + GameConstants.HALF_CELL
 
+        # Time-based shimmer for head
+        time_ms = pygame.time.get_ticks()
+        shimmer = math.sin(time_ms * 0.002) * 0.2 + 0.8
+        head_layers = self._create_head_layers(shimmer)
+
+        # The head layers and eyes only depend on the direction and the
+        # shimmer colors, so they are drawn once into a sprite
+        key = (direction, tuple(layer["color"] for layer in head_layers))
+        head_sprite = self._head_sprites.get(key)
+        if head_sprite is None:
+            head_sprite = render_sprite(
+                _HEAD_SPRITE_RADIUS * 2,
+                lambda surface: self._draw_head_features(
+                    surface,
+                    _HEAD_SPRITE_RADIUS,
+                    _HEAD_SPRITE_RADIUS,
+                    direction,
+                    head_layers,
+                ),
+            )
+            self._head_sprites[key] = head_sprite
+        blit_sequence = [
+            (
+                head_sprite,
+                (center_x - _HEAD_SPRITE_RADIUS, center_y - _HEAD_SPRITE_RADIUS),
+            )
+        ]
+
+        # The tongue flickers, so it is checked every frame and layered
+        # between the head and the nostrils it overlaps
+        tongue_blit = self._get_tongue_blit(center_x, center_y, direction)
+        if tongue_blit is not None:
+            blit_sequence.append(tongue_blit)
+
+        nostril_sprite = self._nostril_sprites.get(direction)
+        if nostril_sprite is None:
+            nostril_sprite = render_sprite(
+                _NOSTRIL_SPRITE_RADIUS * 2,
+                lambda surface: self._draw_nostrils(
+                    surface, _NOSTRIL_SPRITE_RADIUS, _NOSTRIL_SPRITE_RADIUS, direction
+                ),
+            )
+            self._nostril_sprites[direction] = nostril_sprite
+        blit_sequence.append(
+            (
+                nostril_sprite,
+                (center_x - _NOSTRIL_SPRITE_RADIUS, center_y - _NOSTRIL_SPRITE_RADIUS),
+            )
+        )
+
+        self.screen.blits(blit_sequence, doreturn=False)
+
+    def _draw_head_features(
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        direction: Direction,
+        head_layers: List[HeadLayer],
+    ):
+        """Draw the head layers and eyes, facing the given direction.
+
+        Args:
+            surface: Surface to draw on
+            center_x: Head center x position
+            center_y: Head center y position
+            direction: Snake's current direction
+            head_layers: Shaded layers of the head
+        """
         # More elongated head dimensions
         base_width = 14
         base_height = 24  # Much more elongated
@@ -387,28 +548,24 @@ class SnakeHeadRenderer:
             head_width, head_height = base_width, base_height
 
         # Draw multi-layered elongated head
-        self._draw_head_layers(center_x, center_y, head_width, head_height)
+        self._draw_head_layers(
+            surface, center_x, center_y, head_width, head_height, head_layers
+        )
 
         # Draw features
-        self._draw_eyes(center_x, center_y, direction)
-        self._draw_tongue(center_x, center_y, direction)
-        self._draw_nostrils(center_x, center_y, direction)
+        self._draw_eyes(surface, center_x, center_y, direction)
 
-    def _draw_head_layers(self, center_x: int, center_y: int, width: int, height: int):
-        """Draw multiple layers for elongated snake head with green coloring.
+    def _create_head_layers(self, shimmer: float) -> List[HeadLayer]:
+        """Create the shaded layers of the head.
 
         Args:
-            center_x: Head center x position
-            center_y: Head center y position
-            width: Head width
-            height: Head height
-        """
-        # Time-based shimmer for head
-        time_ms = pygame.time.get_ticks()
-        shimmer = math.sin(time_ms * 0.002) * 0.2 + 0.8
+            shimmer: Shimmer intensity
 
+        Returns:
+            Head layers from the outer shadow to the top highlight
+        """
         # Green head layers with proper elongated shape
-        head_layers: List[HeadLayer] = [
+        return [
             {
                 "color": (int(15 * shimmer), int(60 * shimmer), int(15 * shimmer)),
                 "offset": (-2, -2),
@@ -441,6 +598,25 @@ class SnakeHeadRenderer:
             },
         ]
 
+    def _draw_head_layers(
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        width: int,
+        height: int,
+        head_layers: List[HeadLayer],
+    ):
+        """Draw multiple layers for elongated snake head with green coloring.
+
+        Args:
+            surface: Surface to draw on
+            center_x: Head center x position
+            center_y: Head center y position
+            width: Head width
+            height: Head height
+            head_layers: Shaded layers of the head
+        """
         # Draw each head layer with elongated shape
         for layer in head_layers:
             layer_width = int(width * layer["size_mult"])
@@ -459,12 +635,19 @@ class SnakeHeadRenderer:
             )
 
             # Draw elongated elliptical head shape
-            pygame.draw.ellipse(self.screen, layer["color"], head_rect)
+            pygame.draw.ellipse(surface, layer["color"], head_rect)
 
-    def _draw_eyes(self, center_x: int, center_y: int, direction: Direction):
+    def _draw_eyes(
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        direction: Direction,
+    ):
         """Draw realistic snake eyes.
 
         Args:
+            surface: Surface to draw on
             center_x: Head center x position
             center_y: Head center y position
             direction: Snake's current direction
@@ -491,15 +674,15 @@ class SnakeHeadRenderer:
         for eye_pos in [eye1_pos, eye2_pos]:
             # Eye socket shadow
             pygame.draw.circle(
-                self.screen, (15, 60, 15), (eye_pos[0], eye_pos[1] + 1), eye_size + 1
+                surface, (15, 60, 15), (eye_pos[0], eye_pos[1] + 1), eye_size + 1
             )
 
             # Eye white/sclera
-            pygame.draw.circle(self.screen, (250, 250, 220), eye_pos, eye_size)
+            pygame.draw.circle(surface, (250, 250, 220), eye_pos, eye_size)
 
             # Iris with golden-green coloring
-            pygame.draw.circle(self.screen, (180, 200, 60), eye_pos, eye_size - 1)
-            pygame.draw.circle(self.screen, (160, 180, 40), eye_pos, eye_size - 2)
+            pygame.draw.circle(surface, (180, 200, 60), eye_pos, eye_size - 1)
+            pygame.draw.circle(surface, (160, 180, 40), eye_pos, eye_size - 2)
 
             # Vertical slit pupil
             pupil_rect = pygame.Rect(
@@ -508,29 +691,69 @@ class SnakeHeadRenderer:
                 pupil_width,
                 pupil_height,
             )
-            pygame.draw.ellipse(self.screen, (0, 0, 0), pupil_rect)
+            pygame.draw.ellipse(surface, (0, 0, 0), pupil_rect)
 
             # Eye shine
             shine_pos = (eye_pos[0] - 2, eye_pos[1] - 2)
-            pygame.draw.circle(self.screen, (255, 255, 255), shine_pos, 2)
+            pygame.draw.circle(surface, (255, 255, 255), shine_pos, 2)
             small_shine_pos = (eye_pos[0] + 1, eye_pos[1] - 1)
-            pygame.draw.circle(self.screen, (200, 200, 200), small_shine_pos, 1)
+            pygame.draw.circle(surface, (200, 200, 200), small_shine_pos, 1)
 
-    def _draw_tongue(self, center_x: int, center_y: int, direction: Direction):
-        """Draw a flickering forked tongue.
+    def _get_tongue_blit(
+        self, center_x: int, center_y: int, direction: Direction
+    ) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the tongue sprite and position if the tongue is out this frame.
 
         Args:
             center_x: Head center x position
             center_y: Head center y position
             direction: Snake's current direction
+
+        Returns:
+            The sprite and its screen position, or None while it is hidden
         """
         # Tongue flickers based on time
         time_ms = pygame.time.get_ticks()
         tongue_visible = (time_ms // 300) % 3 != 0
 
         if not tongue_visible:
-            return
+            return None
+
+        # The tongue's shape only depends on the direction, so it is drawn
+        # once into a sprite cropped to the tongue itself
+        cached = self._tongue_sprites.get(direction)
+        if cached is None:
+            sprite = render_sprite(
+                _TONGUE_SPRITE_RADIUS * 2,
+                lambda surface: self._draw_tongue_shape(
+                    surface, _TONGUE_SPRITE_RADIUS, _TONGUE_SPRITE_RADIUS, direction
+                ),
+            )
+            bounds = sprite.get_bounding_rect()
+            cached = (
+                sprite.subsurface(bounds).copy(),
+                (bounds.x - _TONGUE_SPRITE_RADIUS, bounds.y - _TONGUE_SPRITE_RADIUS),
+            )
+            self._tongue_sprites[direction] = cached
+
+        tongue_sprite, (offset_x, offset_y) = cached
+        return tongue_sprite, (center_x + offset_x, center_y + offset_y)
+
+    def _draw_tongue_shape(
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        direction: Direction,
+    ):
+        """Draw the forked tongue, facing the given direction.
 
+        Args:
+            surface: Surface to draw on
+            center_x: Head center x position
+            center_y: Head center y position
+            direction: Snake's current direction
+        """
         tongue_length = 10
         tongue_color = (220, 20, 60)
 
@@ -557,14 +780,21 @@ class SnakeHeadRenderer:
             fork2_end = (center_x + 2, center_y + 8 + tongue_length)
 
         # Draw tongue
-        pygame.draw.line(self.screen, tongue_color, tongue_start, tongue_end, 2)
-        pygame.draw.line(self.screen, tongue_color, tongue_end, fork1_end, 1)
-        pygame.draw.line(self.screen, tongue_color, tongue_end, fork2_end, 1)
+        pygame.draw.line(surface, tongue_color, tongue_start, tongue_end, 2)
+        pygame.draw.line(surface, tongue_color, tongue_end, fork1_end, 1)
+        pygame.draw.line(surface, tongue_color, tongue_end, fork2_end, 1)
 
-    def _draw_nostrils(self, center_x: int, center_y: int, direction: Direction):
+    def _draw_nostrils(
+        self,
+        surface: pygame.Surface,
+        center_x: int,
+        center_y: int,
+        direction: Direction,
+    ):
         """Draw detailed nostrils.
 
         Args:
+            surface: Surface to draw on
             center_x: Head center x position
             center_y: Head center y position
             direction: Snake's current direction
@@ -590,15 +820,15 @@ class SnakeHeadRenderer:
         for nostril_pos in [nostril1_pos, nostril2_pos]:
             # Nostril shadow for depth
             pygame.draw.circle(
-                self.screen,
+                surface,
                 (5, 20, 5),
                 (nostril_pos[0], nostril_pos[1] + 1),
                 nostril_size,
             )
             # Main nostril
-            pygame.draw.circle(self.screen, nostril_color, nostril_pos, nostril_size)
+            pygame.draw.circle(surface, nostril_color, nostril_pos, nostril_size)
             # Inner nostril darkness
-            pygame.draw.circle(self.screen, (0, 0, 0), nostril_pos, nostril_size - 1)
+            pygame.draw.circle(surface, (0, 0, 0), nostril_pos, nostril_size - 1)
 
 
 class SnakeScaleRenderer:
@@ -607,6 +837,9 @@ class SnakeScaleRenderer:
     def __init__(self, screen: pygame.Surface):
         """Initialize the scale renderer."""
         self.screen = screen
+        # Rendered scale sprites by (size, base green, bright green, alpha);
+        # shimmer only ever produces a few hundred distinct keys
+        self._scale_sprites: Dict[Tuple[int, int, int, int], pygame.Surface] = {}
 
     def draw_scales(self, points: List[Tuple[int, int]]):
         """Draw green scale patterns with stripe effects.
@@ -616,6 +849,7 @@ class SnakeScaleRenderer:
         """
         scale_spacing = 20
         time_ms = pygame.time.get_ticks()
+        blit_sequence = []
 
         for i in range(0, len(points) - 1, scale_spacing):
             if i + 1 < len(points):
@@ -633,27 +867,36 @@ class SnakeScaleRenderer:
                 stripe_pattern = math.sin(i * 0.4) > 0.3
                 stripe_intensity = 0.7 if stripe_pattern else 1.0
 
-                self._draw_single_scale(point, scale_size, shimmer, stripe_intensity)
+                sprite = self._get_scale_sprite(scale_size, shimmer, stripe_intensity)
+                blit_sequence.append(
+                    (sprite, (point[0] - scale_size - 1, point[1] - scale_size - 1))
+                )
 
-    def _draw_single_scale(
-        self,
-        point: Tuple[int, int],
-        scale_size: int,
-        shimmer: float,
-        stripe_intensity: float,
-    ):
-        """Draw a single scale with proper coloring.
+        if blit_sequence:
+            self.screen.blits(blit_sequence, doreturn=False)
+
+    def _get_scale_sprite(
+        self, scale_size: int, shimmer: float, stripe_intensity: float
+    ) -> pygame.Surface:
+        """Return the diamond scale sprite for the given size and coloring.
 
         Args:
-            point: Scale position
             scale_size: Size of the scale
             shimmer: Shimmer intensity
             stripe_intensity: Stripe pattern intensity
+
+        Returns:
+            Surface of size ``scale_size * 2 + 2`` with the scale centred
         """
         base_green = int(80 * shimmer * stripe_intensity)
         bright_green = int(160 * shimmer * stripe_intensity)
-
         scale_alpha = int(90 * shimmer)
+
+        key = (scale_size, base_green, bright_green, scale_alpha)
+        sprite = self._scale_sprites.get(key)
+        if sprite is not None:
+            return sprite
+
         scale_color = (
             int(base_green * 0.5),
             base_green,
@@ -667,32 +910,27 @@ class SnakeScaleRenderer:
             int(scale_alpha * 0.7),
         )
 
-        # Draw diamond scale
-        scale_points = [
-            (point[0] - scale_size, point[1]),
-            (point[0], point[1] - scale_size),
-            (point[0] + scale_size, point[1]),
-            (point[0], point[1] + scale_size),
-        ]
-
         # Create surface for alpha blending
-        scale_surface = pygame.Surface(
+        sprite = pygame.Surface(
             (scale_size * 2 + 2, scale_size * 2 + 2), pygame.SRCALPHA
         )
 
-        # Adjust points for surface coordinates
+        # Draw diamond scale in surface coordinates
+        center = scale_size + 1
         surface_points = [
-            (x - point[0] + scale_size + 1, y - point[1] + scale_size + 1)
-            for x, y in scale_points
+            (center - scale_size, center),
+            (center, center - scale_size),
+            (center + scale_size, center),
+            (center, center + scale_size),
         ]
 
-        pygame.draw.polygon(scale_surface, scale_color, surface_points)
+        pygame.draw.polygon(sprite, scale_color, surface_points)
 
         # Add highlight
         if scale_size > 1:
             highlight_points = [(x - 1, y - 1) for x, y in surface_points]
-            pygame.draw.polygon(scale_surface, highlight_color, highlight_points)
+            pygame.draw.polygon(sprite, highlight_color, highlight_points)
 
-        self.screen.blit(
-            scale_surface, (point[0] - scale_size - 1, point[1] - scale_size - 1)
-        )
+        sprite = convert_alpha(sprite)
+        self._scale_sprites[key] = sprite
+        return sprite
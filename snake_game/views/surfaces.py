@@ -0,0 +1,49 @@
+"""Surface helpers shared by the game renderers."""
+
+from typing import Callable
+
+import pygame
+
+
+def convert(surface: pygame.Surface) -> pygame.Surface:
+    """Convert an opaque surface to the display pixel format once a display exists.
+
+    Args:
+        surface: Surface without per-pixel alpha
+
+    Returns:
+        The converted surface, or the original when no display is set
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
+def convert_alpha(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display pixel format once a display exists.
+
+    Args:
+        surface: Surface with per-pixel alpha
+
+    Returns:
+        The converted surface, or the original when no display is set
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def render_sprite(size: int, draw: Callable[[pygame.Surface], None]) -> pygame.Surface:
+    """Render a drawing into a transparent sprite.
+
+    Args:
+        size: Width and height of the sprite
+        draw: Callable that draws onto the surface it is given, at sprite
+            coordinates
+
+    Returns:
+        The rendered sprite, in the display pixel format once a display exists
+    """
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    draw(sprite)
+    return convert_alpha(sprite)
@@ -2,10 +2,12 @@
 
 from unittest.mock import Mock, patch
 
+import pygame
 import pytest
 
 from snake_game.controllers import GameController
 from snake_game.models import Direction, GameState
+from snake_game.utils import GameConstants
 
 
 class TestGameIntegration:
@@ -28,6 +30,19 @@ class TestGameIntegration:
         assert controller.input_handler is not None
         assert controller.audio_manager is not None
 
+    @patch("pygame.display.set_mode")
+    @patch("pygame.display.set_caption")
+    def test_event_queue_filtering(self, mock_caption, mock_display):
+        """Test that only handled event types reach the event queue."""
+        mock_display.return_value = Mock()
+
+        GameController()
+
+        assert not pygame.event.get_blocked(pygame.QUIT)
+        assert not pygame.event.get_blocked(pygame.KEYDOWN)
+        assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+        assert pygame.event.get_blocked(pygame.KEYUP)
+
     @patch("pygame.display.set_mode")
     @patch("pygame.display.set_caption")
     def test_game_state_transitions(self, mock_caption, mock_display):
@@ -107,6 +122,94 @@ class TestGameIntegration:
         )  # Should be at least the same or more
         assert controller.speed < initial_speed  # Speed should increase
 
+    @patch("pygame.display.set_mode")
+    @patch("pygame.display.set_caption")
+    def test_fixed_step_movement(self, mock_caption, mock_display):
+        """Test that movement steps are driven by elapsed monotonic time."""
+        mock_display.return_value = Mock()
+
+        controller = GameController()
+        controller._start_game()
+        controller.last_update_ns = 0
+        step_ns = controller.speed * 1_000_000
+
+        with (
+            patch(
+                "snake_game.controllers.game_controller.time.monotonic_ns",
+                return_value=step_ns * 5 // 2,
+            ),
+            patch.object(controller, "_move_snake") as mock_move,
+        ):
+            controller._update()
+
+        assert mock_move.call_count == 2
+        assert controller.move_accumulator_ns == step_ns // 2
+
+    @patch("pygame.display.set_mode")
+    @patch("pygame.display.set_caption")
+    def test_fixed_step_catch_up_is_capped(self, mock_caption, mock_display):
+        """Test that a long stall does not replay an unbounded number of moves."""
+        mock_display.return_value = Mock()
+
+        controller = GameController()
+        controller._start_game()
+        controller.last_update_ns = 0
+        step_ns = controller.speed * 1_000_000
+
+        with (
+            patch(
+                "snake_game.controllers.game_controller.time.monotonic_ns",
+                return_value=step_ns * 100,
+            ),
+            patch.object(controller, "_move_snake") as mock_move,
+        ):
+            controller._update()
+
+        assert mock_move.call_count == GameConstants.MAX_CATCH_UP_MOVES
+
+    @patch("pygame.display.set_mode")
+    @patch("pygame.display.set_caption")
+    def test_render_updates_only_changed_areas(self, mock_caption, mock_display):
+        """Test only reported areas are presented, and unchanged frames skip it."""
+        mock_display.return_value = Mock()
+
+        controller = GameController()
+        controller.renderer = Mock()
+        controller.renderer.render_splash_screen.return_value = []
+        controller.renderer.render_game_screen.return_value = [(0, 0, 10, 10)]
+
+        with (
+            patch("pygame.display.flip") as mock_flip,
+            patch("pygame.display.update") as mock_update,
+        ):
+            controller._render()
+            mock_update.assert_not_called()
+            mock_flip.assert_not_called()
+
+            controller._start_game()
+            controller._render()
+            mock_update.assert_called_once_with([(0, 0, 10, 10)])
+            mock_flip.assert_not_called()
+
+            # Large changes are presented with a single flip
+            controller.renderer.render_game_screen.return_value = [
+                (0, 0, GameConstants.WINDOW_WIDTH, GameConstants.WINDOW_HEIGHT // 2)
+            ]
+            controller._render()
+            mock_update.assert_called_once()
+            mock_flip.assert_called_once()
+            mock_flip.reset_mock()
+            controller.renderer.render_game_screen.return_value = [(0, 0, 10, 10)]
+
+            # An uncovered window is presented in full once
+            controller.window_exposed = True
+            controller._render()
+            mock_flip.assert_called_once()
+            assert controller.window_exposed is False
+            controller._render()
+            mock_flip.assert_called_once()
+            assert mock_update.call_count == 2
+
     @patch("pygame.display.set_mode")
     @patch("pygame.display.set_caption")
     def test_collision_detection_integration(self, mock_caption, mock_display):
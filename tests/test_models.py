@@ -24,6 +24,11 @@ class TestSnake:
         assert snake.set_direction(Direction.LEFT) is False
         assert snake.next_direction == Direction.RIGHT
 
+    def test_direction_deltas(self):
+        """Test that direction deltas match the enum values."""
+        for direction in Direction:
+            assert (direction.dx, direction.dy) == direction.value
+
     def test_move_without_growth(self, snake):
         """Test snake movement without growth."""
         initial_length = snake.length
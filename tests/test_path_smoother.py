@@ -1,6 +1,24 @@
 """Tests for path smoothing utilities."""
 
-from snake_game.utils.path_smoother import PathSmoother
+import numpy as np
+
+from snake_game.utils.path_smoother import _catmull_rom_weights, PathSmoother
+
+
+def _catmull_rom_point(p0, p1, p2, p3, t):
+    """Evaluate the Catmull-Rom spline at t with scalar arithmetic."""
+    return tuple(
+        int(
+            0.5
+            * (
+                2 * b
+                + (-a + c) * t
+                + (2 * a - 5 * b + 4 * c - d) * t * t
+                + (-a + 3 * b - 3 * c + d) * t * t * t
+            )
+        )
+        for a, b, c, d in zip(p0, p1, p2, p3)
+    )
 
 
 class TestPathSmoother:
@@ -45,88 +63,114 @@ class TestPathSmoother:
         assert result[0] == points[0]
         # Note: Last point might be slightly different due to curve smoothing
 
-    def test_interpolate_points(self):
-        """Test point interpolation."""
-        start = (0, 0)
-        end = (10, 10)
-        num_points = 5
-
-        result = PathSmoother._interpolate_points(start, end, num_points)
-
-        assert len(result) == num_points
-        assert result[0] == start
-        assert result[-1] == end
-
-        # Check intermediate points
-        expected_points = [(0, 0), (2, 2), (5, 5), (7, 7), (10, 10)]
-        for i, (x, y) in enumerate(result):
-            expected_x, expected_y = expected_points[i]
-            assert abs(x - expected_x) <= 1  # Allow for rounding
-            assert abs(y - expected_y) <= 1
-
-    def test_enhanced_catmull_rom_spline(self):
-        """Test Catmull-Rom spline calculation."""
-        p0 = (0, 0)
-        p1 = (10, 0)
-        p2 = (20, 10)
-        p3 = (30, 10)
-
-        # Test at different t values
-        result_start = PathSmoother._enhanced_catmull_rom_spline(p0, p1, p2, p3, 0.0)
-        result_end = PathSmoother._enhanced_catmull_rom_spline(p0, p1, p2, p3, 1.0)
-        result_mid = PathSmoother._enhanced_catmull_rom_spline(p0, p1, p2, p3, 0.5)
-
-        # At t=0, should be close to p1
-        assert abs(result_start[0] - p1[0]) <= 1
-        assert abs(result_start[1] - p1[1]) <= 1
-
-        # At t=1, should be close to p2
-        assert abs(result_end[0] - p2[0]) <= 1
-        assert abs(result_end[1] - p2[1]) <= 1
-
-        # At t=0.5, should be between p1 and p2
-        assert p1[0] <= result_mid[0] <= p2[0]
-
-    def test_create_curved_segment(self):
-        """Test curved segment creation."""
-        start = (0, 0)
-        end = (10, 0)
-        prev = (-10, 0)
-        next_point = (20, 0)
-
-        result = PathSmoother._create_curved_segment(start, end, prev, next_point, 1.0)
-
-        assert len(result) == 16  # Default number of points
-        assert result[0] == start
-        assert result[-1] == end
-
-    def test_create_curved_segment_no_context(self):
-        """Test curved segment creation without context points."""
-        start = (0, 0)
-        end = (10, 10)
-
-        result = PathSmoother._create_curved_segment(start, end, None, None, 1.0)
-
-        assert len(result) == 16
-        assert result[0] == start
-        assert result[-1] == end
-
-    def test_create_curved_segment_curve_intensity(self):
-        """Test curved segment with different curve intensities."""
-        start = (0, 0)
-        end = (10, 0)
-
-        # Low intensity should be closer to straight line
-        result_low = PathSmoother._create_curved_segment(start, end, None, None, 0.1)
-        result_high = PathSmoother._create_curved_segment(start, end, None, None, 1.0)
-
-        # Both should have same number of points
-        assert len(result_low) == len(result_high)
-
-        # High intensity should have more curve (points further from straight line)
-        # This is a basic check - in practice, curve differences would be more subtle
-        assert len(result_low) > 0
-        assert len(result_high) > 0
+    def test_create_smooth_path_matches_scalar_spline(self):
+        """Test the vectorized path equals the per-segment scalar construction."""
+        points = [(102, 202), (122, 202), (122, 222), (142, 222), (142, 262), (82, 262)]
+        result = PathSmoother.create_smooth_path(points)
+
+        # Head and tail segments use end points reflected as ghost neighbours
+        ghost_head = (2 * points[0][0] - points[1][0], 2 * points[0][1] - points[1][1])
+        ghost_tail = (
+            2 * points[-1][0] - points[-2][0],
+            2 * points[-1][1] - points[-2][1],
+        )
+        padded = [ghost_head] + points + [ghost_tail]
+
+        expected = [points[0]]
+        for i in range(1, len(padded) - 2):
+            expected.extend(
+                _catmull_rom_point(*padded[i - 1 : i + 3], step / 15)
+                for step in range(1, 16)
+            )
+
+        assert result == expected
+        assert result[-1] == points[-1]
+
+    def test_create_smooth_path_passes_through_points(self):
+        """Test every segment adds 15 curve points ending on the next point."""
+        points = [(-10, 0), (0, 0), (10, 0), (10, 20), (40, 20)]
+
+        result = PathSmoother.create_smooth_path(points)
+
+        assert len(result) == 1 + (len(points) - 1) * 15
+        assert result[::15] == points
+
+    def test_create_smooth_path_two_points_matches_scalar_formula(self):
+        """Test two-point interpolation truncates exactly like int()."""
+        start = (-37, 415)
+        end = (293, -8)
+
+        result = PathSmoother.create_smooth_path([start, end])
+
+        expected = [
+            (
+                int(start[0] + (end[0] - start[0]) * (i / 7)),
+                int(start[1] + (end[1] - start[1]) * (i / 7)),
+            )
+            for i in range(8)
+        ]
+        assert result == expected
+        assert all(type(c) is int for point in result for c in point)
+
+    def test_catmull_rom_segments(self):
+        """Test one spline window runs from p1 to p2 along the scalar curve."""
+        controls = np.array([(0, 0), (10, 0), (20, 10), (30, 10)])
+        out = np.empty((15, 2), dtype=np.int32)
+
+        PathSmoother._catmull_rom_segments(controls, out)
+
+        expected = [
+            _catmull_rom_point(*controls.tolist(), step / 15) for step in range(1, 16)
+        ]
+        assert [tuple(p) for p in out.tolist()] == expected
+        assert tuple(out[-1]) == (20, 10)
+
+    def test_create_smooth_path_arr(self):
+        """Test the array API matches the list API."""
+        points = [(0, 0), (10, 0), (10, 10), (0, 10), (0, 30)]
+
+        result = PathSmoother.create_smooth_path_arr(np.array(points))
+
+        assert result.dtype == np.int32
+        assert result.shape[1] == 2
+        assert [tuple(p) for p in result.tolist()] == PathSmoother.create_smooth_path(
+            points
+        )
+
+    def test_create_smooth_segment_path(self):
+        """Test grid segments give the same path as the two-step list API."""
+        segments = [(5, 5), (4, 5), (4, 6), (3, 6), (2, 6)]
+
+        result = PathSmoother.create_smooth_segment_path(segments)
+
+        screen_points = PathSmoother.convert_segments_to_screen_points(segments)
+        assert result == PathSmoother.create_smooth_path(screen_points)
+        assert all(type(x) is int and type(y) is int for x, y in result)
+
+    def test_create_smooth_path_arr_short_input(self):
+        """Test the array API with fewer than two points."""
+        assert PathSmoother.create_smooth_path_arr(np.empty((0, 2))).shape == (0, 2)
+        result = PathSmoother.create_smooth_path_arr(np.array([(4, 5)]))
+        assert result.tolist() == [[4, 5]]
+
+    def test_catmull_rom_weights(self):
+        """Test the integer weight matrix evaluates the spline polynomial."""
+        weights, scale = _catmull_rom_weights(16)
+        controls = [(3, -7), (41, 12), (88, 95), (60, 140)]
+
+        assert weights.shape == (4, 15)
+        for step in range(1, 16):
+            t = step / 15
+            for axis in range(2):
+                p0, p1, p2, p3 = (c[axis] for c in controls)
+                expected = 0.5 * (
+                    2 * p1
+                    + (-p0 + p2) * t
+                    + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t * t
+                    + (-p0 + 3 * p1 - 3 * p2 + p3) * t * t * t
+                )
+                value = sum(c[axis] * w for c, w in zip(controls, weights[:, step - 1]))
+                assert abs(value / scale - expected) < 1e-9
 
     def test_convert_segments_to_screen_points(self):
         """Test conversion from grid to screen coordinates."""
@@ -155,6 +199,18 @@ class TestPathSmoother:
             assert screen_x == expected_x
             assert screen_y == expected_y
 
+    def test_convert_segments_to_screen_array(self):
+        """Test array conversion matches the list conversion."""
+        segments = [(0, 0), (5, 10), (39, 29)]
+
+        result = PathSmoother.convert_segments_to_screen_array(segments)
+
+        assert result.dtype == np.int32
+        assert [
+            tuple(p) for p in result.tolist()
+        ] == PathSmoother.convert_segments_to_screen_points(segments)
+        assert PathSmoother.convert_segments_to_screen_array([]).shape == (0, 2)
+
     def test_convert_segments_empty_list(self):
         """Test conversion with empty segment list."""
         result = PathSmoother.convert_segments_to_screen_points([])
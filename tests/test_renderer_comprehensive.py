@@ -1,11 +1,14 @@
 """Comprehensive tests for GameRenderer to improve coverage."""
 
+import math
 from unittest.mock import Mock, patch
 
 import pygame
 
 from snake_game.models import Direction, Fruit, FruitType, Snake
+from snake_game.utils import GameConstants
 from snake_game.views.renderer import GameRenderer
+from snake_game.views.surfaces import render_sprite
 
 
 class TestGameRendererComprehensive:
@@ -123,7 +126,7 @@ class TestGameRendererComprehensive:
             # Verify screen was filled and text was rendered
             mock_screen.fill.assert_called()
             assert mock_font_instance.render.call_count > 0
-            assert mock_screen.blit.call_count > 0
+            mock_screen.blits.assert_called_once()
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.pygame.draw.rect")
@@ -184,7 +187,7 @@ class TestGameRendererComprehensive:
             # Verify screen was filled and text was rendered
             mock_screen.fill.assert_called()
             assert mock_font_instance.render.call_count > 0
-            assert mock_screen.blit.call_count > 0
+            mock_screen.blits.assert_called_once()
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     def test_render_high_scores_screen(self, mock_font):
@@ -207,7 +210,7 @@ class TestGameRendererComprehensive:
             # Verify screen was filled and text was rendered
             mock_screen.fill.assert_called()
             assert mock_font_instance.render.call_count > 0
-            assert mock_screen.blit.call_count > 0
+            mock_screen.blits.assert_called_once()
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     def test_render_confirm_reset_screen(self, mock_font):
@@ -229,7 +232,187 @@ class TestGameRendererComprehensive:
             # Verify screen was filled and text was rendered
             mock_screen.fill.assert_called()
             assert mock_font_instance.render.call_count > 0
-            assert mock_screen.blit.call_count > 0
+            mock_screen.blits.assert_called_once()
+
+    @patch("snake_game.views.snake_renderer.pygame.time.get_ticks", return_value=0)
+    def test_render_game_screen_dirty_areas(self, mock_ticks):
+        """Test the game screen reports changed areas and matches a full redraw."""
+        snake = Snake(initial_length=5, start_x=10, start_y=10)
+        fruit = Fruit(grid_width=40, grid_height=30)
+        fruit.position = (20, 20)
+
+        screen = pygame.Surface(
+            (GameConstants.WINDOW_WIDTH, GameConstants.WINDOW_HEIGHT)
+        )
+        renderer = GameRenderer(screen)
+        renderer._images_loaded = True
+
+        # Entering the screen updates the whole window
+        areas = renderer.render_game_screen(snake, fruit, 0, 200)
+        assert areas == [screen.get_rect()]
+
+        # Unchanged UI values leave the UI bar alone
+        snake.move()
+        with patch.object(renderer, "_draw_ui") as mock_draw_ui:
+            areas = renderer.render_game_screen(snake, fruit, 0, 200)
+        mock_draw_ui.assert_not_called()
+        assert len(areas) == 1
+        assert pygame.Rect(areas[0]).top == GameConstants.UI_HEIGHT
+
+        # A new score redraws the UI bar as well
+        snake.move()
+        areas = renderer.render_game_screen(snake, fruit, 4, 190)
+        assert pygame.Rect(0, 0, GameConstants.WINDOW_WIDTH, 1).collidelist(areas) >= 0
+
+        fresh_screen = pygame.Surface(screen.get_size())
+        fresh = GameRenderer(fresh_screen)
+        fresh._images_loaded = True
+        fresh.render_game_screen(snake, fruit, 4, 190)
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(
+            fresh_screen, "RGB"
+        )
+
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    def test_render_text_cache(self, mock_font):
+        """Test that rendered text surfaces are reused and the cache is bounded."""
+        mock_font_instance = Mock()
+        mock_font.return_value = mock_font_instance
+
+        renderer = GameRenderer(Mock())
+
+        first = renderer._render_text(renderer.font, "Score: 4", (255, 255, 255))
+        second = renderer._render_text(renderer.font, "Score: 4", (255, 255, 255))
+        assert first is second
+        mock_font_instance.render.assert_called_once_with(
+            "Score: 4", True, (255, 255, 255)
+        )
+
+        # A different color is a different surface
+        renderer._render_text(renderer.font, "Score: 4", (255, 0, 0))
+        assert mock_font_instance.render.call_count == 2
+
+        with patch("snake_game.views.renderer._TEXT_CACHE_SIZE", 3):
+            for score in range(10):
+                renderer._render_text(renderer.font, f"Score: {score}", (0, 0, 0))
+                assert len(renderer._text_cache) <= 3
+
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    def test_render_text_centered_cache(self, mock_font):
+        """Test centered text reuses both the rendered surface and its rect."""
+        mock_font_instance = Mock()
+        mock_font.return_value = mock_font_instance
+        mock_font_instance.render.return_value.get_rect.side_effect = (
+            lambda center: pygame.Rect(0, 0, 40, 20).move(
+                center[0] - 20, center[1] - 10
+            )
+        )
+
+        renderer = GameRenderer(Mock())
+
+        first = renderer._render_text_centered(
+            renderer.font, "Press Q to quit", (255, 255, 255), (100, 50)
+        )
+        second = renderer._render_text_centered(
+            renderer.font, "Press Q to quit", (255, 255, 255), (100, 50)
+        )
+        assert first is second
+        assert first[1].center == (100, 50)
+        mock_font_instance.render.assert_called_once()
+
+        # The same text elsewhere shares the surface but gets its own rect
+        moved = renderer._render_text_centered(
+            renderer.font, "Press Q to quit", (255, 255, 255), (100, 90)
+        )
+        assert moved[0] is first[0]
+        assert moved[1].center == (100, 90)
+        mock_font_instance.render.assert_called_once()
+
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    def test_static_screen_repaints_only_on_change(self, mock_font):
+        """Test that static screens are only redrawn when their content changes."""
+        mock_screen = Mock()
+        mock_font_instance = Mock()
+        mock_font.return_value = mock_font_instance
+        mock_surface = Mock()
+        mock_font_instance.render.return_value = mock_surface
+        mock_surface.get_rect.return_value = pygame.Rect(0, 0, 100, 50)
+
+        renderer = GameRenderer(mock_screen)
+
+        window = [(0, 0, GameConstants.WINDOW_WIDTH, GameConstants.WINDOW_HEIGHT)]
+        assert renderer.render_high_scores_screen([100, 90]) == window
+        assert renderer.render_high_scores_screen([100, 90]) == []
+        assert mock_screen.fill.call_count == 1
+        assert mock_screen.blits.call_count == 1
+
+        # Changed content is redrawn
+        assert renderer.render_high_scores_screen([0, 0]) == window
+        assert mock_screen.fill.call_count == 2
+
+        # Switching screens and coming back redraws as well
+        assert renderer.render_confirm_reset_screen() == window
+        assert renderer.render_confirm_reset_screen() == []
+        renderer.render_high_scores_screen([0, 0])
+        assert mock_screen.fill.call_count == 4
+        assert mock_screen.blits.call_count == 4
+
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    def test_game_over_title_pulse(self, mock_font):
+        """Test the title color follows the pulse at 16 ms resolution."""
+        renderer = GameRenderer(Mock())
+
+        for ticks in (0, 100, 315, 627, 628, 5000):
+            quantized = ticks % 628 // 16 * 16
+            expected = int(255 * (abs(math.sin(quantized * 0.005)) * 0.3 + 0.7))
+            with (
+                patch(
+                    "snake_game.views.renderer.pygame.time.get_ticks",
+                    return_value=ticks,
+                ),
+                patch.object(
+                    renderer,
+                    "_render_text_centered",
+                    return_value=(Mock(), pygame.Rect(10, 20, 30, 40)),
+                ) as mock_render_text,
+            ):
+                renderer.render_game_over_screen(100, False)
+            mock_render_text.assert_called_with(
+                renderer.large_font,
+                "GAME OVER!",
+                (expected, 0, 0),
+                (GameConstants.WINDOW_CENTER_X, 150),
+            )
+
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    def test_game_over_static_layer_drawn_once(self, mock_font):
+        """Test that only the pulsing title is redrawn on later game over frames."""
+        mock_screen = Mock()
+        mock_font_instance = Mock()
+        mock_font.return_value = mock_font_instance
+        mock_surface = Mock()
+        mock_font_instance.render.return_value = mock_surface
+        title_rect = pygame.Rect(0, 0, 100, 50)
+        mock_surface.get_rect.return_value = title_rect
+
+        renderer = GameRenderer(mock_screen)
+
+        first_areas = renderer.render_game_over_screen(100, True)
+        later_areas = renderer.render_game_over_screen(100, True)
+
+        # Only the title needs presenting once the static layer is shown
+        assert first_areas == [
+            (0, 0, GameConstants.WINDOW_WIDTH, GameConstants.WINDOW_HEIGHT)
+        ]
+        assert later_areas == [tuple(title_rect)]
+
+        # The full clear and static text happen once
+        mock_screen.blits.assert_called_once()
+        full_fills = [c for c in mock_screen.fill.call_args_list if len(c[0]) == 1]
+        assert len(full_fills) == 1
+
+        # The title area is cleared and drawn every frame
+        mock_screen.fill.assert_called_with(GameConstants.BLACK, title_rect)
+        assert mock_screen.blit.call_count == 2
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.pygame.draw.circle")
@@ -267,11 +450,40 @@ class TestGameRendererComprehensive:
         renderer = GameRenderer(mock_screen)
         renderer._draw_ui(150, 8, 5)
 
-        # Verify text was rendered and blitted
+        # Verify text was rendered and blitted with the background in one call
         assert mock_font_instance.render.call_count >= 3  # Score, length, speed
-        assert mock_screen.blit.call_count >= 3
+        mock_screen.blits.assert_called_once()
+        blit_sequence = mock_screen.blits.call_args[0][0]
+        assert blit_sequence[0] == (renderer._ui_background, (0, 0))
+        assert len(blit_sequence) == 5
+        mock_screen.blit.assert_not_called()
         mock_rect.assert_called()  # UI background
 
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    @patch("snake_game.views.renderer.pygame.draw.rect")
+    def test_draw_border(self, mock_rect, mock_font):
+        """Test _draw_border outlines the play area and clears its inside."""
+        mock_screen = Mock()
+        renderer = GameRenderer(mock_screen)
+
+        renderer._draw_border()
+
+        border_call, play_call = mock_rect.call_args_list
+        border_rect = pygame.Rect(border_call[0][2])
+        play_rect = pygame.Rect(play_call[0][2])
+        assert border_call[0][1] == GameConstants.BROWN
+        assert border_rect.bottom == GameConstants.WINDOW_HEIGHT
+        assert (
+            border_rect.inflate(
+                -2 * GameConstants.BORDER_WIDTH, -2 * GameConstants.BORDER_WIDTH
+            )
+            == play_rect
+        )
+        assert play_rect.topleft == (
+            GameConstants.PLAY_AREA_X,
+            GameConstants.PLAY_AREA_Y,
+        )
+
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.pygame.draw.circle")
     def test_draw_decorative_fruit_custom(self, mock_circle, mock_font):
@@ -279,11 +491,29 @@ class TestGameRendererComprehensive:
         mock_screen = Mock()
         mock_font.return_value = Mock()
 
-        renderer = GameRenderer(mock_screen)
+        with patch.object(GameRenderer, "_draw_decorative_apple") as mock_apple:
+            renderer = GameRenderer(mock_screen)
+            renderer._draw_decorative_fruit_custom(
+                mock_screen, 100, 100, FruitType.APPLE
+            )
+            mock_apple.assert_called_once_with(mock_screen, 100, 100)
 
-        with patch.object(renderer, "_draw_decorative_apple") as mock_apple:
-            renderer._draw_decorative_fruit_custom(100, 100, FruitType.APPLE)
-            mock_apple.assert_called_once_with(100, 100)
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    def test_draw_fruit_custom_dispatch(self, mock_font):
+        """Test _draw_fruit_custom dispatches to the drawer for the fruit name."""
+        fruit = Mock()
+        fruit.name = "cherry"
+        surface = Mock()
+
+        with patch.object(GameRenderer, "_draw_custom_cherry") as mock_cherry:
+            renderer = GameRenderer(Mock())
+            renderer._draw_fruit_custom(surface, 40, 60, fruit)
+            renderer._draw_fruit_custom(surface, 40, 60, fruit)
+
+        half = GameConstants.HALF_CELL
+        mock_cherry.assert_called_with(surface, 40 + half, 60 + half, 40, 60)
+        assert mock_cherry.call_count == 2
+        assert set(renderer._custom_fruit_drawers) == {t.value[0] for t in FruitType}
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.pygame.draw.circle")
@@ -297,7 +527,7 @@ class TestGameRendererComprehensive:
         mock_font.return_value = Mock()
 
         renderer = GameRenderer(mock_screen)
-        renderer._draw_decorative_apple(100, 100)
+        renderer._draw_decorative_apple(mock_screen, 100, 100)
 
         # Verify circles, rect, and ellipse were drawn
         assert mock_circle.call_count >= 2  # Apple body circles
@@ -316,12 +546,17 @@ class TestGameRendererComprehensive:
         mock_font.return_value = Mock()
 
         renderer = GameRenderer(mock_screen)
-        renderer._draw_decorative_banana(100, 100)
+        renderer._draw_decorative_banana(mock_screen, 100, 100)
 
         # Verify polygon, circle, and line were drawn
         mock_polygon.assert_called()  # Banana body
         mock_circle.assert_called()  # Stem
         mock_line.assert_called()  # Banana curve
+        mock_polygon.assert_called_once_with(
+            mock_screen,
+            (255, 255, 0),
+            [(90, 104), (92, 90), (104, 92), (112, 108), (106, 110), (92, 108)],
+        )
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.pygame.draw.circle")
@@ -332,7 +567,7 @@ class TestGameRendererComprehensive:
         mock_font.return_value = Mock()
 
         renderer = GameRenderer(mock_screen)
-        renderer._draw_decorative_cherry(100, 100)
+        renderer._draw_decorative_cherry(mock_screen, 100, 100)
 
         # Verify circles were drawn (two cherries)
         assert mock_circle.call_count >= 4  # Two cherries with outlines
@@ -347,11 +582,58 @@ class TestGameRendererComprehensive:
         mock_font.return_value = Mock()
 
         renderer = GameRenderer(mock_screen)
-        renderer._draw_decorative_orange(100, 100)
+        renderer._draw_decorative_orange(mock_screen, 100, 100)
 
         # Verify circle was drawn
         mock_circle.assert_called()
 
+    @patch("snake_game.views.renderer.pygame.font.Font")
+    @patch("snake_game.views.renderer.pygame.draw.circle")
+    def test_orange_peel_dots(self, mock_circle, mock_font):
+        """Test oranges draw exactly the peel dots inside their outline."""
+        renderer = GameRenderer(Mock())
+
+        renderer._draw_decorative_orange(renderer.screen, 100, 100)
+        dots = [c[0][2] for c in mock_circle.call_args_list if c[0][3] == 1]
+        # The 5x5 grid at 4 px spacing, minus the center and the four corners
+        assert dots == [
+            (92, 96),
+            (92, 100),
+            (92, 104),
+            (96, 92),
+            (96, 96),
+            (96, 100),
+            (96, 104),
+            (96, 108),
+            (100, 92),
+            (100, 96),
+            (100, 104),
+            (100, 108),
+            (104, 92),
+            (104, 96),
+            (104, 100),
+            (104, 104),
+            (104, 108),
+            (108, 96),
+            (108, 100),
+            (108, 104),
+        ]
+
+        mock_circle.reset_mock()
+        renderer._draw_custom_orange(renderer.screen, 50, 50, 40, 40)
+        dots = [c[0][2] for c in mock_circle.call_args_list if c[0][3] == 1]
+        # The 3x3 grid at 3 px spacing, minus the center
+        assert dots == [
+            (47, 47),
+            (47, 50),
+            (47, 53),
+            (50, 47),
+            (50, 53),
+            (53, 47),
+            (53, 50),
+            (53, 53),
+        ]
+
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.pygame.draw.circle")
     @patch("snake_game.views.renderer.pygame.draw.ellipse")
@@ -364,7 +646,7 @@ class TestGameRendererComprehensive:
         mock_font.return_value = Mock()
 
         renderer = GameRenderer(mock_screen)
-        renderer._draw_decorative_pear(100, 100)
+        renderer._draw_decorative_pear(mock_screen, 100, 100)
 
         # Verify circles, ellipse, and rect were drawn
         assert mock_circle.call_count >= 2  # Pear body parts
@@ -426,6 +708,58 @@ class TestGameRendererComprehensive:
         assert result is True
         # Check that the image was stored with the fruit name as key
         assert "apple" in renderer.fruit_images
+        assert renderer.fruit_images_splash["apple"] is mock_image
+        mock_scale.assert_called_once_with(renderer.fruit_images["apple"], (32, 32))
+
+    def test_custom_fruit_sprites_match_direct_drawing(self):
+        """Test cached fruit sprites produce the same pixels as drawing directly."""
+        for fruit_type in FruitType:
+            fruit = Mock(position=(3, 4))
+            fruit.name = fruit_type.value[0]
+
+            direct = pygame.Surface((200, 200))
+            renderer = GameRenderer(direct)
+            screen_x = GameConstants.PLAY_AREA_X + 3 * GameConstants.CELL_SIZE
+            screen_y = GameConstants.PLAY_AREA_Y + 4 * GameConstants.CELL_SIZE
+            renderer._draw_fruit_custom(direct, screen_x, screen_y, fruit)
+            renderer._draw_decorative_fruit_custom(direct, 150, 150, fruit_type)
+
+            cached = pygame.Surface((200, 200))
+            renderer = GameRenderer(cached)
+            renderer._images_loaded = True
+            for _ in range(2):
+                renderer._draw_fruit(fruit)
+                renderer._draw_decorative_fruit_image(150, 150, fruit_type)
+
+            assert pygame.image.tobytes(direct, "RGB") == pygame.image.tobytes(
+                cached, "RGB"
+            )
+            assert list(renderer._fruit_sprites) == [fruit.name]
+            assert list(renderer._decorative_fruit_sprites) == [fruit.name]
+
+    def test_loaded_surfaces_match_display_format(self):
+        """Test that images and text are converted to the display pixel format."""
+        screen = pygame.display.set_mode((64, 64))
+        try:
+            renderer = GameRenderer(screen)
+            renderer._ensure_images_loaded()
+            assert renderer.use_images is True
+
+            surfaces = [
+                *renderer.fruit_images.values(),
+                *renderer.fruit_images_splash.values(),
+                renderer._get_splash_snake_image(),
+                renderer._render_text(renderer.font, "Score: 0", GameConstants.WHITE),
+                render_sprite(8, lambda surface: None),
+                renderer.snake_scale_renderer._get_scale_sprite(3, 0.9, 1.0),
+            ]
+            display_format = pygame.Surface((1, 1)).convert_alpha()
+            for surface in surfaces:
+                assert surface.get_bitsize() == display_format.get_bitsize()
+                assert surface.get_masks() == display_format.get_masks()
+        finally:
+            pygame.display.quit()
+            pygame.display.init()
 
     @patch("snake_game.views.renderer.pygame.font.Font")
     @patch("snake_game.views.renderer.os.path.exists")
@@ -57,31 +57,21 @@ class TestGameRendererRefactored:
         renderer.snake_body_renderer.draw_body.assert_not_called()
         renderer.snake_scale_renderer.draw_scales.assert_not_called()
 
-    @patch(
-        "snake_game.utils.path_smoother.PathSmoother.convert_segments_to_screen_points"
-    )
-    @patch("snake_game.utils.path_smoother.PathSmoother.create_smooth_path")
-    def test_draw_snake_multiple_segments(
-        self, mock_smooth_path, mock_convert, renderer
-    ):
+    @patch("snake_game.utils.path_smoother.PathSmoother.create_smooth_segment_path")
+    def test_draw_snake_multiple_segments(self, mock_smooth_path, renderer):
         """Test drawing snake with multiple segments."""
         snake = Mock()
         snake.segments = [(5, 5), (4, 5), (3, 5)]
         snake.direction = Direction.RIGHT
 
-        mock_screen_points = [(100, 100), (80, 100), (60, 100)]
         mock_smooth_points = [(100, 100), (90, 100), (80, 100), (70, 100), (60, 100)]
 
-        mock_convert.return_value = mock_screen_points
         mock_smooth_path.return_value = mock_smooth_points
 
         renderer._draw_snake(snake)
 
-        # Should convert segments to screen points
-        mock_convert.assert_called_once_with(snake.segments)
-
-        # Should create smooth path
-        mock_smooth_path.assert_called_once_with(mock_screen_points)
+        # Should convert segments to a smooth screen path
+        mock_smooth_path.assert_called_once_with(snake.segments)
 
         # Should draw body, scales, and head
         renderer.snake_body_renderer.draw_body.assert_called_once_with(
@@ -94,6 +84,48 @@ class TestGameRendererRefactored:
             5, 5, Direction.RIGHT
         )
 
+    @patch("snake_game.utils.path_smoother.PathSmoother.create_smooth_segment_path")
+    def test_draw_snake_reuses_path_until_segments_change(
+        self, mock_smooth_path, renderer
+    ):
+        """Test the smoothed path is only rebuilt when the snake moves."""
+        snake = Mock()
+        snake.segments = [(5, 5), (4, 5), (3, 5)]
+        snake.direction = Direction.RIGHT
+        mock_smooth_path.return_value = [(100, 100), (80, 100), (60, 100)]
+
+        renderer._draw_snake(snake)
+        renderer._draw_snake(snake)
+        assert mock_smooth_path.call_count == 1
+
+        # Moving in place mutates the same list; the change is still detected
+        snake.segments.insert(0, (6, 5))
+        snake.segments.pop()
+        renderer._draw_snake(snake)
+        assert mock_smooth_path.call_count == 2
+
+    def test_draw_snake_locks_screen_around_primitives(self, renderer, mock_screen):
+        """Test the screen is locked for the body but not for blitted parts."""
+        snake = Mock()
+        snake.segments = [(5, 5), (4, 5), (3, 5)]
+        snake.direction = Direction.RIGHT
+
+        def assert_unlocked(*args):
+            if mock_screen.lock.call_count != mock_screen.unlock.call_count:
+                pytest.fail("screen locked while blitting")
+
+        renderer.snake_scale_renderer.draw_scales.side_effect = assert_unlocked
+        renderer.snake_head_renderer.draw_head.side_effect = assert_unlocked
+        renderer._draw_snake(snake)
+        assert mock_screen.lock.call_count == 1
+        assert mock_screen.unlock.call_count == 1
+
+        # The lock is released even if drawing fails
+        renderer.snake_body_renderer.draw_body.side_effect = RuntimeError
+        with pytest.raises(RuntimeError):
+            renderer._draw_snake(snake)
+        assert mock_screen.lock.call_count == mock_screen.unlock.call_count
+
     def test_draw_snake_empty_segments(self, renderer):
         """Test drawing snake with no segments."""
         snake = Mock()
@@ -136,27 +168,22 @@ class TestGameRendererRefactored:
         snake.direction = Direction.RIGHT
 
         with patch(
-            "snake_game.utils.path_smoother.PathSmoother.convert_segments_to_screen_points"
-        ) as mock_convert:
-            with patch(
-                "snake_game.utils.path_smoother.PathSmoother.create_smooth_path"
-            ) as mock_smooth:
-                mock_convert.return_value = [(100, 100), (80, 100), (60, 100)]
-                mock_smooth.return_value = [
-                    (100, 100),
-                    (90, 100),
-                    (80, 100),
-                    (70, 100),
-                    (60, 100),
-                ]
-
-                renderer._draw_snake(snake)
-
-                # Each component should handle its own responsibility
-                assert renderer.snake_body_renderer.draw_body.called
-                assert renderer.snake_scale_renderer.draw_scales.called
-                assert renderer.snake_head_renderer.draw_head.called
-
-                # Path smoothing should be handled by utility class
-                assert mock_convert.called
-                assert mock_smooth.called
+            "snake_game.utils.path_smoother.PathSmoother.create_smooth_segment_path"
+        ) as mock_smooth:
+            mock_smooth.return_value = [
+                (100, 100),
+                (90, 100),
+                (80, 100),
+                (70, 100),
+                (60, 100),
+            ]
+
+            renderer._draw_snake(snake)
+
+            # Each component should handle its own responsibility
+            assert renderer.snake_body_renderer.draw_body.called
+            assert renderer.snake_scale_renderer.draw_scales.called
+            assert renderer.snake_head_renderer.draw_head.called
+
+            # Path smoothing should be handled by utility class
+            assert mock_smooth.called
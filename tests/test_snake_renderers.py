@@ -1,12 +1,17 @@
 """Tests for snake rendering components."""
 
+import math
 from unittest.mock import Mock, patch
 
 import pygame
 import pytest
 
 from snake_game.models import Direction
+from snake_game.utils import GameConstants
 from snake_game.views.snake_renderer import (
+    _BODY_BAND_SEGMENTS,
+    _drop_collinear_points,
+    _is_striped,
     SnakeBodyRenderer,
     SnakeHeadRenderer,
     SnakeScaleRenderer,
@@ -97,11 +102,11 @@ class TestSnakeBodyRenderer:
         # Should not raise exception
         renderer.draw_body(points, segments)
 
-    @patch("pygame.draw.line")
+    @patch("pygame.draw.lines")
     @patch("pygame.draw.circle")
     @patch("pygame.time.get_ticks")
     def test_draw_body_multiple_points(
-        self, mock_ticks, mock_circle, mock_line, renderer
+        self, mock_ticks, mock_circle, mock_lines, renderer
     ):
         """Test drawing with multiple points."""
         mock_ticks.return_value = 1000
@@ -112,7 +117,81 @@ class TestSnakeBodyRenderer:
         renderer.draw_body(points, segments)
 
         # Should have called drawing functions
-        assert mock_line.called or mock_circle.called
+        assert mock_lines.called or mock_circle.called
+
+    def test_draw_body_draws_path_in_bands(self, renderer):
+        """Test the body is drawn as contiguous polyline bands per stripe."""
+        points = [(100 + i * 2, 100) for i in range(30)]
+
+        with patch.object(renderer, "_draw_striped_band") as mock_band:
+            renderer.draw_body(points, [(5, 5)])
+
+        next_index = 0
+        for band_call in mock_band.call_args_list:
+            band_points, _thickness, _progress, segment_index, _caps = band_call.args
+            band_length = len(band_points) - 1
+            assert segment_index == next_index
+            assert (
+                band_points == points[segment_index : segment_index + band_length + 1]
+            )
+            assert 1 <= band_length <= _BODY_BAND_SEGMENTS
+            stripes = {_is_striped(segment_index + i) for i in range(band_length)}
+            assert len(stripes) == 1
+            next_index += band_length
+        assert next_index == len(points) - 1
+        assert mock_band.call_count < len(points) - 1
+
+    def test_draw_body_skips_end_caps_covered_by_next_band(self, renderer):
+        """Test end caps are only drawn where the next band cannot cover them."""
+        points = [(100 + i * 2, 100) for i in range(60)]
+
+        with patch.object(renderer, "_draw_striped_band") as mock_band:
+            renderer.draw_body(points, [(5, 5)])
+
+        calls = [band_call.args for band_call in mock_band.call_args_list]
+        for (_, thickness, _, _, end_caps), next_call in zip(calls, calls[1:]):
+            assert end_caps == (next_call[1] != thickness)
+        assert calls[-1][4] is True
+        assert not all(args[4] for args in calls)
+
+    @patch("pygame.draw.lines")
+    @patch("pygame.draw.circle")
+    def test_draw_ultra_smooth_polyline_without_end_caps(
+        self, mock_circle, mock_lines, renderer
+    ):
+        """Test only the start of a polyline is capped when end caps are off."""
+        points = [(100, 100), (104, 100)]
+
+        renderer._draw_ultra_smooth_polyline(points, (40, 140, 40), 10, False)
+
+        capped = {circle_call.args[2] for circle_call in mock_circle.call_args_list}
+        assert capped == {points[0]}
+
+    def test_drop_collinear_points(self):
+        """Test straight runs and repeated points collapse to their ends."""
+        straight = [(0, 0), (2, 0), (4, 0), (4, 0), (6, 0)]
+        assert _drop_collinear_points(straight) == [(0, 0), (6, 0)]
+
+        bend = [(0, 0), (2, 0), (4, 0), (4, 2), (4, 4)]
+        assert _drop_collinear_points(bend) == [(0, 0), (4, 0), (4, 4)]
+
+        reversal = [(0, 0), (2, 0), (0, 0)]
+        assert _drop_collinear_points(reversal) == reversal
+
+    @patch("pygame.draw.lines")
+    @patch("pygame.draw.circle")
+    def test_draw_ultra_smooth_polyline_single_call(
+        self, mock_circle, mock_lines, renderer
+    ):
+        """Test a polyline is drawn in one call with caps only at its ends."""
+        points = [(100, 100), (102, 101), (104, 103), (106, 106)]
+
+        renderer._draw_ultra_smooth_polyline(points, (40, 140, 40), 10)
+
+        assert mock_lines.call_count == 2  # main line and anti-aliased edge
+        assert mock_lines.call_args_list[0].args[3] == points
+        capped = {circle_call.args[2] for circle_call in mock_circle.call_args_list}
+        assert capped == {points[0], points[-1]}
 
 
 class TestSnakeHeadRenderer:
@@ -169,49 +248,102 @@ class TestSnakeHeadRenderer:
             renderer.draw_head(5, 5, direction)
             assert mock_ellipse.called
 
+    def test_draw_head_reuses_cached_sprites(self, renderer):
+        """Test the head is blitted from sprites cached by direction and shimmer."""
+        with patch("pygame.time.get_ticks", return_value=400):  # tongue out
+            renderer.draw_head(5, 5, Direction.UP)
+            with patch("pygame.draw.ellipse") as mock_ellipse:
+                renderer.draw_head(6, 5, Direction.UP)
+                mock_ellipse.assert_not_called()
+
+        # Head, tongue and nostrils go out in one blits call per frame
+        assert renderer.screen.blits.call_count == 2
+        first_blits, second_blits = (
+            c.args[0] for c in renderer.screen.blits.call_args_list
+        )
+        assert len(first_blits) == len(second_blits) == 3
+        for (first_sprite, first_pos), (second_sprite, second_pos) in zip(
+            first_blits, second_blits
+        ):
+            assert first_sprite is second_sprite
+            assert second_pos[0] - first_pos[0] == 20  # one cell right
+        assert len(renderer._head_sprites) == 1
+        assert len(renderer._nostril_sprites) == 1
+
+    def test_draw_head_matches_direct_drawing(self):
+        """Test the sprite-based head draws the same pixels as direct drawing."""
+        size = (100, GameConstants.PLAY_AREA_Y + 100)
+        sprite_screen = pygame.Surface(size)
+        direct_screen = pygame.Surface(size)
+        sprite_renderer = SnakeHeadRenderer(sprite_screen)
+        direct_renderer = SnakeHeadRenderer(direct_screen)
+
+        for direction in Direction:
+            sprite_screen.fill((10, 30, 50))
+            direct_screen.fill((10, 30, 50))
+            with patch("pygame.time.get_ticks", return_value=1234):
+                sprite_renderer.draw_head(1, 1, direction)
+
+                offset = GameConstants.CELL_SIZE + GameConstants.HALF_CELL
+                center_x = GameConstants.PLAY_AREA_X + offset
+                center_y = GameConstants.PLAY_AREA_Y + offset
+                layers = direct_renderer._create_head_layers(
+                    math.sin(1234 * 0.002) * 0.2 + 0.8
+                )
+                direct_renderer._draw_head_features(
+                    direct_screen, center_x, center_y, direction, layers
+                )
+                direct_renderer._draw_tongue_shape(
+                    direct_screen, center_x, center_y, direction
+                )
+                direct_renderer._draw_nostrils(
+                    direct_screen, center_x, center_y, direction
+                )
+
+            assert pygame.image.tobytes(sprite_screen, "RGB") == pygame.image.tobytes(
+                direct_screen, "RGB"
+            )
+
     @patch("pygame.time.get_ticks")
     def test_draw_head_layers(self, mock_ticks, renderer):
         """Test head layer drawing."""
         mock_ticks.return_value = 1000
 
         with patch("pygame.draw.ellipse") as mock_ellipse:
-            renderer._draw_head_layers(100, 100, 20, 30)
+            renderer._draw_head_layers(
+                renderer.screen, 100, 100, 20, 30, renderer._create_head_layers(1.0)
+            )
 
             # Should draw multiple layers
             assert mock_ellipse.call_count >= 6  # At least 6 layers
 
+    @patch("pygame.time.get_ticks")
+    def test_tongue_sprite_cached_per_direction(self, mock_ticks, renderer):
+        """Test the tongue is blitted from a cropped sprite drawn once."""
+        mock_ticks.return_value = 400  # visible
+
+        with patch("pygame.draw.line", wraps=pygame.draw.line) as mock_line:
+            first_sprite, first_pos = renderer._get_tongue_blit(
+                100, 100, Direction.LEFT
+            )
+            second_sprite, second_pos = renderer._get_tongue_blit(
+                150, 120, Direction.LEFT
+            )
+            assert mock_line.call_count == 3  # body and two forks, once
+
+        assert first_sprite is second_sprite
+        assert first_sprite.get_size() == (11, 5)
+        assert first_pos == (100 - 18, 100 - 2)
+        assert second_pos == (first_pos[0] + 50, first_pos[1] + 20)
+
     @patch("pygame.time.get_ticks")
     def test_tongue_visibility_timing(self, mock_ticks, renderer):
         """Test tongue visibility based on timing."""
-        with patch("pygame.draw.line") as mock_line:
-            # At 100ms, the tongue is hidden.
-            mock_ticks.return_value = 100
-            renderer._draw_tongue(100, 100, Direction.RIGHT)
-            assert mock_line.call_count == 0
-
-            mock_line.reset_mock()
-
-            # At 300ms, the tongue is visible.
-            mock_ticks.return_value = 300
-            renderer._draw_tongue(100, 100, Direction.RIGHT)
-            assert mock_line.call_count > 0
-
-            # The logic is: (time_ms // 300) % 3 != 0 means visible
-            # At 100ms: (100 // 300) % 3 = 0 % 3 = 0, so NOT visible
-            # At 300ms: (300 // 300) % 3 = 1 % 3 = 1, so visible
-            # Let's test with correct values
-            mock_line.reset_mock()
-            mock_ticks.return_value = 400  # (400 // 300) % 3 = 1, visible
-            renderer._draw_tongue(100, 100, Direction.RIGHT)
-            visible_calls_correct = mock_line.call_count
-
-            mock_line.reset_mock()
-            mock_ticks.return_value = 0  # (0 // 300) % 3 = 0, hidden
-            renderer._draw_tongue(100, 100, Direction.RIGHT)
-            hidden_calls_correct = mock_line.call_count
-
-            # When visible, should have more calls than when hidden
-            assert visible_calls_correct >= hidden_calls_correct
+        # The tongue is out when (time_ms // 300) % 3 != 0
+        for time_ms, visible in ((0, False), (100, False), (300, True), (400, True)):
+            mock_ticks.return_value = time_ms
+            tongue_blit = renderer._get_tongue_blit(100, 100, Direction.RIGHT)
+            assert (tongue_blit is not None) == visible
 
 
 class TestSnakeScaleRenderer:
@@ -260,27 +392,63 @@ class TestSnakeScaleRenderer:
     @patch("pygame.time.get_ticks")
     @patch("pygame.Surface")
     @patch("pygame.draw.polygon")
-    def test_draw_single_scale(self, mock_polygon, mock_surface, mock_ticks, renderer):
-        """Test drawing a single scale."""
+    def test_get_scale_sprite(self, mock_polygon, mock_surface, mock_ticks, renderer):
+        """Test rendering a single scale sprite."""
         mock_ticks.return_value = 1000
         mock_surface_instance = Mock()
         mock_surface.return_value = mock_surface_instance
 
-        renderer._draw_single_scale((100, 100), 3, 1.0, 1.0)
+        renderer._get_scale_sprite(3, 1.0, 1.0)
 
         # Should have created surface and drawn polygon
         assert mock_surface.called
         assert mock_polygon.called
 
+    @patch("pygame.time.get_ticks")
+    def test_draw_scales_blits_cached_sprites_once(self, mock_ticks, renderer):
+        """Test scales are stamped from cached sprites in a single blits call."""
+        mock_ticks.return_value = 1000
+        points = [(100 + i, 100) for i in range(61)]
+
+        renderer.draw_scales(points)
+        renderer.draw_scales(points)
+
+        assert renderer.screen.blits.call_count == 2
+        first, second = (c.args[0] for c in renderer.screen.blits.call_args_list)
+        assert len(first) == 3  # points 0, 20 and 40
+        for (sprite_a, pos_a), (sprite_b, pos_b) in zip(first, second):
+            assert sprite_a is sprite_b
+            assert pos_a == pos_b
+        renderer.screen.blit.assert_not_called()
+
+    def test_scale_sprite_matches_per_scale_drawing(self, renderer):
+        """Test the cached sprite holds the same diamond as a fresh surface."""
+        sprite = renderer._get_scale_sprite(3, 0.9, 0.7)
+
+        expected = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.polygon(
+            expected, (25, 50, 25, 81), [(1, 4), (4, 1), (7, 4), (4, 7)]
+        )
+        pygame.draw.polygon(
+            expected, (60, 100, 60, 56), [(0, 3), (3, 0), (6, 3), (3, 6)]
+        )
+
+        assert renderer._get_scale_sprite(3, 0.9, 0.7) is sprite
+        assert pygame.image.tobytes(sprite, "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        )
+
     def test_scale_size_calculation(self, renderer):
         """Test scale size calculation based on position."""
-        points = [(100, 100), (120, 100), (140, 100), (160, 100)]
+        points = [(100 + i, 100) for i in range(61)]
 
         with patch("pygame.time.get_ticks", return_value=1000):
-            with patch.object(renderer, "_draw_single_scale") as mock_draw:
+            with patch.object(
+                renderer, "_get_scale_sprite", wraps=renderer._get_scale_sprite
+            ) as mock_sprite:
                 renderer.draw_scales(points)
 
-                # Should have been called with different scale sizes
-                # (This is a basic test - actual scale size calculation is complex)
-                if mock_draw.called:
-                    assert True  # At least some scales were drawn
+        # One scale every 20 points, never larger than the base size of 4
+        sizes = [c.args[0] for c in mock_sprite.call_args_list]
+        assert len(sizes) == 3
+        assert all(0 <= size <= 4 for size in sizes)
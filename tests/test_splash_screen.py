@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for splash screen functionality with perfect coiled snake image."""
 
+import math
 import os
 from unittest.mock import Mock, patch
 
@@ -134,6 +135,54 @@ class TestSplashScreenWithCoiledSnake:
                 call[0] for call in calls
             ]  # 804 - 60 = 744
 
+    def test_draw_splash_graphics_batches_fruit_images(self):
+        """Test decorative fruit images are drawn with a single blits call."""
+        self.renderer.use_images = True
+        for fruit_type in FruitType:
+            image = Mock()
+            image.get_rect.side_effect = lambda: pygame.Rect(0, 0, 32, 32)
+            self.renderer.fruit_images_splash[fruit_type.value[0]] = image
+
+        with (
+            patch.object(self.renderer, "_ensure_images_loaded"),
+            patch("snake_game.views.renderer.os.path.exists", return_value=False),
+            patch.object(self.renderer, "_draw_custom_snake_logo"),
+            patch("snake_game.views.renderer.pygame.transform.scale") as mock_scale,
+        ):
+            self.renderer._draw_splash_graphics()
+
+        mock_scale.assert_not_called()
+        self.mock_screen.blit.assert_not_called()
+        self.mock_screen.blits.assert_called_once()
+        blit_sequence = self.mock_screen.blits.call_args[0][0]
+        assert len(blit_sequence) == 8
+        assert blit_sequence[0][1].center == (80, 150)
+
+    @patch("snake_game.views.renderer.pygame.image.load")
+    @patch("snake_game.views.renderer.os.path.exists")
+    def test_splash_snake_image_scaled_once(self, mock_exists, mock_load):
+        """Test the snake logo is looked up, loaded and scaled once across frames."""
+        mock_exists.return_value = True
+        mock_snake_image = Mock()
+        mock_snake_image.convert_alpha.return_value = mock_snake_image
+        mock_load.return_value = mock_snake_image
+
+        with patch("snake_game.views.renderer.pygame.transform.scale") as mock_scale:
+            mock_scale.return_value.get_rect.return_value = Mock()
+
+            with (
+                patch.object(self.renderer, "_ensure_images_loaded"),
+                patch.object(self.renderer, "_draw_decorative_fruit_image"),
+            ):
+                self.renderer._draw_splash_graphics()
+                self.renderer._draw_splash_graphics()
+
+            mock_exists.assert_called_once_with(self.renderer._splash_snake_path)
+            mock_load.assert_called_once()
+            mock_scale.assert_called_once_with(mock_snake_image, (128, 128))
+            assert self.mock_screen.blit.call_count == 2
+            assert self.renderer.splash_snake_scaled is mock_scale.return_value
+
     @patch("snake_game.views.renderer.pygame.font.Font")
     def test_render_splash_screen_calls_components(self, mock_font):
         """Test render_splash_screen calls all necessary components."""
@@ -263,3 +312,16 @@ class TestSplashScreenIntegration:
 
                     # Should fall back to custom snake
                     mock_custom.assert_called_once()
+
+    def test_custom_snake_logo_follows_sine_wave(self):
+        """Test the fallback snake logo segments keep their sine wave positions."""
+        with patch("snake_game.views.renderer.pygame.draw.circle") as mock_circle:
+            self.renderer._draw_custom_snake_logo(400, 100)
+
+        body_centers = [
+            call.args[2] for call in mock_circle.call_args_list if call.args[3] == 12
+        ]
+        expected = [
+            (400 - 100 + i * 25, 100 + int(20 * math.sin(i * 0.5))) for i in range(8)
+        ]
+        assert body_centers == expected
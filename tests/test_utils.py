@@ -38,6 +38,13 @@ class TestGameConstants:
             == GameConstants.GRID_HEIGHT * GameConstants.CELL_SIZE
         )
 
+    def test_center_constants(self):
+        """Test precomputed center coordinates."""
+        assert GameConstants.WINDOW_CENTER_X == GameConstants.WINDOW_WIDTH // 2
+        assert GameConstants.HALF_CELL == GameConstants.CELL_SIZE // 2
+        assert GameConstants.GRID_CENTER_X == GameConstants.GRID_WIDTH // 2
+        assert GameConstants.GRID_CENTER_Y == GameConstants.GRID_HEIGHT // 2
+
     def test_game_mechanics_constants(self):
         """Test game mechanics constants."""
         assert GameConstants.INITIAL_SNAKE_LENGTH == 5
@@ -45,6 +52,7 @@ class TestGameConstants:
         assert GameConstants.SPEED_INCREASE == 10
         assert GameConstants.MIN_SPEED == 50
         assert GameConstants.POINTS_PER_FRUIT == 4
+        assert GameConstants.MAX_CATCH_UP_MOVES >= 1
 
     def test_color_constants(self):
         """Test color constants."""
@@ -79,6 +87,22 @@ class TestAudioManager:
         self.audio_manager.start_background_music()
         self.audio_manager.stop_background_music()
 
+    def test_background_music_baked_in_background(self):
+        """Test that music requested before baking finishes starts afterwards."""
+        if not self.audio_manager.initialized:
+            return
+
+        self.audio_manager.start_background_music()
+        assert self.audio_manager.music_playing is True
+
+        self.audio_manager._music_thread.join()
+        assert self.audio_manager._melody_baked is True
+        assert self.audio_manager._melody_sound is not None
+        assert self.audio_manager.music_playing is True
+
+        self.audio_manager.stop_background_music()
+        assert self.audio_manager.music_playing is False
+
     def test_cleanup(self):
         """Test audio cleanup."""
         # Should not raise exceptions